@@ -11,6 +11,7 @@ from pathlib import Path
 from .core.config import ConfigManager
 from .core.updater import ZedUpdater
 from .utils.logger import setup_logging, get_logger
+from .utils.encoding import EncodingUtils
 
 
 def create_parser():
@@ -85,6 +86,8 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
 
+    EncodingUtils.setup_utf8_environment()
+
     # Setup logging
     setup_logging(
         level=args.log_level,
@@ -5,12 +5,50 @@ Simplified configuration management for Zed Updater
 """
 
 import json
-import os
+import atexit
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Union, Callable
+from dataclasses import dataclass, fields, replace
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils.encoding import EncodingUtils
 from ..utils.logger import get_logger
 
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON, tolerating a UTF-8 BOM left by Windows editors"""
+    if isinstance(raw, bytes) and raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Managers with a debounced save still pending; flushed at interpreter exit
+_pending_saves: 'weakref.WeakSet[ConfigManager]' = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_saves() -> None:
+    for manager in list(_pending_saves):
+        if not manager.flush():
+            manager.logger.error(f"退出时未能保存配置，最近的修改已丢失: {manager.config_file}")
+
 
 @dataclass
 class ConfigData:
@@ -43,16 +81,113 @@ class ConfigData:
     proxy_url: str = ""
 
 
+# Field names resolved once; every value is an immutable scalar, so a shallow
+# snapshot is equivalent to asdict() without its recursive deep copy
+_FIELD_NAMES = tuple(f.name for f in fields(ConfigData))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+
+
+def _int_at_least(minimum: int) -> Callable[[Any], Optional[str]]:
+    """Validator for integers no smaller than minimum"""
+    def check(value: Any) -> Optional[str]:
+        if type(value) is not int or value < minimum:
+            return f"必须是不小于{minimum}的整数"
+        return None
+    return check
+
+
+def _check_install_path(value: Any) -> Optional[str]:
+    if not isinstance(value, str) or not value.strip():
+        return "安装路径不能为空"
+    return None
+
+
+def _check_repo(value: Any) -> Optional[str]:
+    if not isinstance(value, str) or value.count('/') != 1 or not all(value.split('/')):
+        return "格式应为 owner/repo"
+    return None
+
+
+def _check_proxy_url(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return "必须是字符串"
+    if value and not value.startswith(('http://', 'https://', 'socks5://')):
+        return "代理地址应以 http://、https:// 或 socks5:// 开头"
+    return None
+
+
+def _check_language(value: Any) -> Optional[str]:
+    if value not in ('zh_CN', 'en_US'):
+        return "不支持的语言"
+    return None
+
+
+def _check_bool(value: Any) -> Optional[str]:
+    if type(value) is not bool:
+        return "必须是布尔值"
+    return None
+
+
+# One validator per field, run in a single pass by ConfigManager.validate()
+_VALIDATORS: Dict[str, Callable[[Any], Optional[str]]] = {
+    'zed_install_path': _check_install_path,
+    'github_repo': _check_repo,
+    'check_interval_hours': _int_at_least(1),
+    'backup_count': _int_at_least(1),
+    'download_timeout': _int_at_least(1),
+    'retry_count': _int_at_least(0),
+    'proxy_url': _check_proxy_url,
+    'language': _check_language,
+}
+_VALIDATORS.update(
+    (f.name, _check_bool) for f in fields(ConfigData) if f.type in (bool, 'bool')
+)
+
+
 class ConfigManager:
-    """Simplified configuration manager"""
+    """
+    Simplified configuration manager
+
+    Settings live in a ConfigData instance that is never mutated in place:
+    writers build a replacement under the lock and rebind self._config,
+    which is atomic. Readers take no lock; binding self._config once gives
+    them a consistent view of every field.
+    """
 
     DEFAULT_CONFIG_FILE = "config.json"
+    SAVE_DELAY = 0.5  # seconds a burst of set() calls is coalesced over
 
     def __init__(self, config_file: Optional[str] = None):
+        self._init_state(config_file)
+        self._load_config()
+
+    def _init_state(self, config_file: Optional[str]) -> None:
+        """Set up every instance attribute; shared by __init__ and from_mapping"""
         self.logger = get_logger(__name__)
         self.config_file = Path(config_file or self.DEFAULT_CONFIG_FILE)
         self._config = ConfigData()
-        self._load_config()
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False  # changes not yet on disk, including after a failed save
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any], config_file: Optional[str] = None) -> 'ConfigManager':
+        """Build a manager from an in-memory mapping without touching disk"""
+        manager = cls.__new__(cls)
+        manager._init_state(config_file)
+        manager._apply(data)
+        return manager
+
+    @classmethod
+    def from_json_bytes(cls, raw: Union[bytes, str], config_file: Optional[str] = None) -> 'ConfigManager':
+        """Build a manager from serialized JSON without touching disk"""
+        return cls.from_mapping(_loads(raw), config_file)
+
+    def _apply(self, data: Dict[str, Any]) -> None:
+        """Swap in a config object with the known keys from data applied"""
+        changes = {key: value for key, value in data.items() if key in _FIELD_SET}
+        if changes:
+            self._config = replace(self._config, **changes)
 
     def _load_config(self) -> None:
         """Load configuration from file"""
@@ -62,14 +197,7 @@ class ConfigManager:
                 self._save_config()
                 return
 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Update config object
-            for key, value in data.items():
-                if hasattr(self._config, key):
-                    setattr(self._config, key, value)
-
+            self._apply(_loads(self.config_file.read_bytes()))
             self.logger.info("配置文件加载成功")
 
         except (json.JSONDecodeError, FileNotFoundError) as e:
@@ -80,9 +208,8 @@ class ConfigManager:
     def _save_config(self) -> bool:
         """Save configuration to file"""
         try:
-            config_dict = asdict(self._config)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            # Swapped in atomically, so a crash never leaves a truncated file
+            EncodingUtils._atomic_write(self.config_file, (_dumps(self._snapshot()),), backup=False)
             self.logger.info("配置文件保存成功")
             return True
         except Exception as e:
@@ -94,22 +221,88 @@ class ConfigManager:
         return getattr(self._config, key, default)
 
     def set(self, key: str, value: Any) -> bool:
-        """Set configuration value"""
-        if hasattr(self._config, key):
-            setattr(self._config, key, value)
-            return self._save_config()
-        return False
+        """
+        Set configuration value
+
+        The write to disk is deferred by SAVE_DELAY, so the result only says
+        whether the value was accepted, not that it was persisted. Callers
+        that need durability must call flush() and check its result.
+
+        Args:
+            key: Configuration key
+            value: New value
+
+        Returns:
+            True if key is a known setting and the value was applied in memory
+        """
+        if key not in _FIELD_SET:
+            return False
+        with self._lock:
+            self._config = replace(self._config, **{key: value})
+            self._dirty = True
+            self._schedule_save()
+        return True
 
     def update(self, updates: Dict[str, Any]) -> bool:
-        """Update multiple configuration values"""
-        for key, value in updates.items():
-            if hasattr(self._config, key):
-                setattr(self._config, key, value)
-        return self._save_config()
+        """Update multiple configuration values and save immediately"""
+        with self._lock:
+            self._apply(updates)
+            self._dirty = True
+            return self._save_now()
+
+    def flush(self) -> bool:
+        """
+        Write any deferred changes to disk now
+
+        Returns:
+            True if nothing was pending or the save succeeded; False if the
+            save failed, in which case the changes stay pending for a retry
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            return self._save_now()
+
+    def _save_now(self) -> bool:
+        """Cancel the debounce timer and save; caller holds the lock"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if not self._save_config():
+            # Keep the changes pending so a later flush() or exit retries
+            _pending_saves.add(self)
+            return False
+        self._dirty = False
+        _pending_saves.discard(self)
+        return True
+
+    def _schedule_save(self) -> None:
+        """(Re)start the debounce timer; caller holds the lock"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+        _pending_saves.add(self)
+
+    def validate(self) -> Dict[str, str]:
+        """Validate configuration values, returning {key: error message}"""
+        config = self._config
+        errors = {}
+        for key, check in _VALIDATORS.items():
+            message = check(getattr(config, key))
+            if message:
+                errors[key] = message
+        return errors
 
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration values"""
-        return asdict(self._config)
+        return self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Shallow copy of all configuration values"""
+        config = self._config
+        return {name: getattr(config, name) for name in _FIELD_NAMES}
 
     def get_backup_dir(self) -> Path:
         """Get backup directory path"""
@@ -120,6 +313,10 @@ class ConfigManager:
         """Get temporary directory path"""
         return Path.home() / ".zed_updater" / "temp"
 
+    def get_cache_dir(self) -> Path:
+        """Get cache directory path"""
+        return Path.home() / ".zed_updater" / "cache"
+
     def ensure_directories(self) -> None:
         """Ensure all required directories exist"""
         try:
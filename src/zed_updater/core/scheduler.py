@@ -35,6 +35,8 @@ class UpdateScheduler:
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._update_callbacks: list[Callable[[bool, UpdateResult], None]] = []
+        self._status_callbacks: list[Callable[[ScheduleStatus], None]] = []
+        self._published_status: Optional[tuple] = None
 
         self._status = ScheduleStatus(
             is_running=False,
@@ -53,6 +55,29 @@ class UpdateScheduler:
         if callback in self._update_callbacks:
             self._update_callbacks.remove(callback)
 
+    def add_status_callback(self, callback: Callable[[ScheduleStatus], None]) -> None:
+        """Add callback invoked whenever the running flag or next run time changes"""
+        if callback not in self._status_callbacks:
+            self._status_callbacks.append(callback)
+
+    def remove_status_callback(self, callback: Callable[[ScheduleStatus], None]) -> None:
+        """Remove status callback"""
+        if callback in self._status_callbacks:
+            self._status_callbacks.remove(callback)
+
+    def _publish_status(self) -> None:
+        """Notify status callbacks, but only if the visible status changed"""
+        snapshot = (self._status.is_running, self._status.next_run_time)
+        if snapshot == self._published_status:
+            return
+        self._published_status = snapshot
+
+        for callback in self._status_callbacks:
+            try:
+                callback(self._status)
+            except Exception as e:
+                self.logger.error(f"Status callback failed: {e}")
+
     def _notify_callbacks(self, update_available: bool, result: Optional[UpdateResult] = None) -> None:
         """Notify all registered callbacks"""
         for callback in self._update_callbacks:
@@ -71,11 +96,13 @@ class UpdateScheduler:
             self.logger.info("Auto-check is disabled, not starting scheduler")
             return False
 
+        # Mark running before the loop can publish its first next-run time
+        self._status.is_running = True
+
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self._thread.start()
 
-        self._status.is_running = True
         self._update_next_run_time()
 
         self.logger.info("Update scheduler started")
@@ -92,6 +119,7 @@ class UpdateScheduler:
 
         self._status.is_running = False
         self._status.next_run_time = None
+        self._publish_status()
 
         self.logger.info("Update scheduler stopped")
         return True
@@ -108,9 +136,12 @@ class UpdateScheduler:
     def force_check_now(self) -> UpdateResult:
         """Force an immediate update check"""
         self.logger.info("Forced update check initiated")
+        return self._run_check(allow_cached=False)
 
+    def _run_check(self, allow_cached: bool) -> UpdateResult:
+        """Run one check; scheduled polls may reuse recently cached release info"""
         try:
-            result = self.updater.check_and_update()
+            result = self.updater.check_and_update(allow_cached=allow_cached)
             self._status.last_run_time = datetime.now()
             self._status.last_result = result
 
@@ -160,7 +191,7 @@ class UpdateScheduler:
 
                     # Time to run the check
                     self.logger.info("Scheduled update check starting")
-                    self.force_check_now()
+                    self._run_check(allow_cached=True)
 
                     # Add small delay before next iteration
                     time.sleep(1)
@@ -181,6 +212,7 @@ class UpdateScheduler:
         try:
             if not self.config.get('auto_check_enabled'):
                 self._status.next_run_time = None
+                self._publish_status()
                 return
 
             interval_hours = self.config.get('check_interval_hours', 24)
@@ -212,6 +244,8 @@ class UpdateScheduler:
             self.logger.error(f"Failed to calculate next run time: {e}")
             self._status.next_run_time = None
 
+        self._publish_status()
+
     def get_next_run_time(self) -> Optional[datetime]:
         """Get the next scheduled run time"""
         return self._status.next_run_time
@@ -5,6 +5,7 @@ Simplified Zed Editor updater - Unified architecture
 """
 
 import os
+import re
 import shutil
 import hashlib
 import tempfile
@@ -19,6 +20,7 @@ from datetime import datetime
 import requests
 import psutil
 from .config import ConfigManager
+from ..utils.encoding import EncodingUtils
 from ..utils.logger import get_logger
 
 
@@ -45,19 +47,42 @@ class ReleaseInfo:
 class ZedUpdater:
     """Simplified and unified Zed updater"""
 
-    def __init__(self, config: ConfigManager):
+    # Scheduled polls serve cached release JSON without a request for this
+    # long; explicit checks, and polls after it, revalidate with If-None-Match,
+    # and a 304 costs no rate limit
+    RELEASE_CACHE_TTL = 15 * 60
+    RELEASE_CACHE_SCHEMA = 1
+
+    # Download read size; larger chunks mean fewer Python-level iterations
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config: ConfigManager, cache_dir: Optional[Path] = None):
         self.config = config
         self.logger = get_logger(__name__)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._session: Optional[requests.Session] = None
+        self._cache_dir = cache_dir
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, built on first use so construction stays cheap"""
+        if self._session is None:
+            self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        """Create the HTTP session with headers and proxy settings"""
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'ZedUpdater/2.0',
             'Accept': 'application/vnd.github.v3+json'
         })
 
         # Setup proxy if configured
-        if config.get('proxy_enabled') and config.get('proxy_url'):
-            proxy_url = config.get('proxy_url')
-            self.session.proxies = {'http': proxy_url, 'https': proxy_url}
+        if self.config.get('proxy_enabled') and self.config.get('proxy_url'):
+            proxy_url = self.config.get('proxy_url')
+            session.proxies = {'http': proxy_url, 'https': proxy_url}
+
+        return session
 
     def get_current_version(self) -> Optional[str]:
         """Get currently installed Zed version"""
@@ -93,7 +118,6 @@ class ZedUpdater:
                     # Parse version from output
                     output = result.stdout.strip()
                     # Extract version number (simple heuristic)
-                    import re
                     match = re.search(r'(\d+\.\d+\.\d+)', output)
                     if match:
                         return match.group(1)
@@ -107,15 +131,21 @@ class ZedUpdater:
         # Return unknown if we can't determine version
         return "unknown"
 
-    def get_latest_version_info(self) -> Optional[ReleaseInfo]:
-        """Get latest version information from GitHub"""
+    def get_latest_version_info(self, allow_cached: bool = False) -> Optional[ReleaseInfo]:
+        """
+        Get latest version information from GitHub
+
+        Args:
+            allow_cached: Serve a cache entry younger than RELEASE_CACHE_TTL
+                without a request (scheduled polls); otherwise always revalidate
+
+        Returns:
+            Release information, or None on failure
+        """
         try:
             repo = self.config.get('github_repo', 'TC999/zed-loc')
             url = f"https://api.github.com/repos/{repo}/releases/latest"
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_latest_release(repo, url, allow_cached)
             
             # Extract version from tag
             tag_name = data.get('tag_name', '')
@@ -153,10 +183,84 @@ class ZedUpdater:
             self.logger.error(f"Failed to get latest version info: {e}")
             return None
 
-    def check_for_updates(self) -> Optional[ReleaseInfo]:
-        """Check if updates are available"""
+    def _fetch_latest_release(self, repo: str, url: str, allow_cached: bool = False) -> Dict[str, Any]:
+        """Return the latest release JSON, revalidating the local cache entry"""
+        cache = self._read_release_cache(repo)
+        now = time.time()
+        if allow_cached and cache and now - cache['cached_at'] < self.RELEASE_CACHE_TTL:
+            self.logger.debug("Using cached release info")
+            return cache['payload']
+
+        headers = {}
+        if cache and cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304 and cache:
+            self.logger.debug("Release info not modified, refreshing cache")
+            cache['cached_at'] = now
+            self._write_release_cache(cache)
+            return cache['payload']
+
+        response.raise_for_status()
+        data = response.json()
+        self._write_release_cache({
+            'schema_version': self.RELEASE_CACHE_SCHEMA,
+            'repo': repo,
+            'etag': response.headers.get('ETag'),
+            'cached_at': now,
+            'payload': data,
+        })
+        return data
+
+    def _release_cache_file(self) -> Optional[Path]:
+        """Path of the cached latest-release entry, or None if caching is unavailable"""
+        cache_dir = self._cache_dir
+        if cache_dir is None:
+            try:
+                cache_dir = self.config.get_cache_dir()
+            except Exception:
+                return None
+        if not isinstance(cache_dir, (str, Path)):
+            return None
+        return Path(cache_dir) / "latest_release.json"
+
+    def _read_release_cache(self, repo: str) -> Optional[Dict[str, Any]]:
+        """Load the cached release entry for repo, or None if absent or stale-format"""
+        cache_file = self._release_cache_file()
+        if cache_file is None:
+            return None
+
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (not isinstance(cache, dict)
+                or cache.get('schema_version') != self.RELEASE_CACHE_SCHEMA
+                or cache.get('repo') != repo
+                or not isinstance(cache.get('cached_at'), (int, float))
+                or not isinstance(cache.get('payload'), dict)):
+            return None
+        return cache
+
+    def _write_release_cache(self, cache: Dict[str, Any]) -> None:
+        """Atomically replace the release cache; failures only cost a refetch"""
+        cache_file = self._release_cache_file()
+        if cache_file is None:
+            return
+
+        try:
+            data = json.dumps(cache, ensure_ascii=False).encode('utf-8')
+            EncodingUtils._atomic_write(cache_file, (data,), backup=False)
+        except OSError as e:
+            self.logger.debug(f"Failed to write release cache: {e}")
+
+    def check_for_updates(self, allow_cached: bool = False) -> Optional[ReleaseInfo]:
+        """Check if updates are available; see get_latest_version_info for allow_cached"""
         current_version = self.get_current_version()
-        latest_info = self.get_latest_version_info()
+        latest_info = self.get_latest_version_info(allow_cached)
 
         if not latest_info:
             return None
@@ -178,7 +282,6 @@ class ZedUpdater:
 
         try:
             # Handle date-based versions (e.g., "2024-01-15")
-            from datetime import datetime
             try:
                 current_date = datetime.strptime(current, "%Y-%m-%d")
                 latest_date = datetime.strptime(latest, "%Y-%m-%d")
@@ -187,7 +290,6 @@ class ZedUpdater:
                 pass
 
             # Handle semantic versions
-            import re
             current_parts = re.findall(r'\d+', current)
             latest_parts = re.findall(r'\d+', latest)
 
@@ -232,17 +334,22 @@ class ZedUpdater:
                     
                     total_size = int(response.headers.get('content-length', 0))
                     downloaded_size = 0
+                    report_progress = progress_callback is not None and total_size > 0
+                    last_permille = -1
                     
                     with open(download_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                             if chunk:
                                 f.write(chunk)
                                 downloaded_size += len(chunk)
                                 
-                                # Report progress
-                                if progress_callback and total_size > 0:
-                                    progress = (downloaded_size / total_size) * 100
-                                    progress_callback(progress, f"下载中... {progress:.1f}%")
+                                # Report progress only when the displayed 0.1% step changes
+                                if report_progress:
+                                    permille = downloaded_size * 1000 // total_size
+                                    if permille != last_permille:
+                                        last_permille = permille
+                                        progress = permille / 10
+                                        progress_callback(progress, f"下载中... {progress:.1f}%")
                     
                     self.logger.info(f"下载完成: {download_path}")
                     return download_path
@@ -400,11 +507,15 @@ class ZedUpdater:
         except Exception as e:
             self.logger.warning(f"停止Zed进程时出错: {e}")
 
-    def check_and_update(self, progress_callback: Optional[Callable[[float, str], None]] = None) -> UpdateResult:
-        """检查更新并执行安装"""
+    def check_and_update(
+        self,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        allow_cached: bool = False
+    ) -> UpdateResult:
+        """检查更新并执行安装（allow_cached仅供定时检查使用缓存的发布信息）"""
         try:
             # 检查更新
-            release_info = self.check_for_updates()
+            release_info = self.check_for_updates(allow_cached)
             if not release_info:
                 return UpdateResult(
                     success=True,
@@ -5,8 +5,10 @@ Main window for Zed Updater GUI
 """
 
 import sys
+import logging
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -15,14 +17,14 @@ from PyQt5.QtWidgets import (
     QSplitter, QScrollArea
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtGui import QIcon, QFont, QFontDatabase
 
 from ..core.config import ConfigManager
 from ..core.updater import ZedUpdater, UpdateResult
 from ..core.scheduler import UpdateScheduler
 from ..services.system_service import SystemService
 from ..services.notification_service import NotificationService
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, UTF8Formatter
 from ..utils.encoding import EncodingUtils
 
 from .updater_gui import UpdaterGUI
@@ -30,12 +32,39 @@ from .system_tray import SystemTrayIcon
 from .settings_dialog import SettingsDialog
 
 
+@functools.lru_cache(maxsize=1)
+def _available_font_families() -> frozenset:
+    """Installed font families, enumerated once (needs a QApplication)"""
+    return frozenset(QFontDatabase().families())
+
+
+class _SignalLogHandler(logging.Handler):
+    """Logging handler that forwards formatted records to a Qt signal"""
+
+    def __init__(self, emit: Callable[[str], None]):
+        super().__init__()
+        self._emit = emit
+        self.setFormatter(UTF8Formatter(use_colors=False))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # Signal emission is queued onto the GUI thread, so this is safe
+            # from worker and scheduler threads
+            self._emit(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
     # Signals
     update_progress = pyqtSignal(float, str)
     update_completed = pyqtSignal(bool, str)
+    log_message = pyqtSignal(str)
+
+    # Lines kept in the log view; older ones are dropped as new ones arrive
+    LOG_VIEW_MAX_LINES = 1000
 
     def __init__(self, config: ConfigManager, updater: ZedUpdater,
                  scheduler: UpdateScheduler):
@@ -111,13 +140,10 @@ class MainWindow(QMainWindow):
             font = QFont()
             if sys.platform == 'win32':
                 chinese_fonts = ['Microsoft YaHei', 'SimHei', 'SimSun', 'Arial Unicode MS']
-                for font_name in chinese_fonts:
-                    available_fonts = QFontDatabase().families()
-                    if font_name in available_fonts:
-                        font.setFamily(font_name)
-                        break
-                else:
-                    font.setFamily("Arial")
+                available_fonts = _available_font_families()
+                font.setFamily(next(
+                    (name for name in chinese_fonts if name in available_fonts), "Arial"
+                ))
             else:
                 font.setFamily("Sans Serif")
 
@@ -250,6 +276,7 @@ class MainWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 8))
+        self.log_text.document().setMaximumBlockCount(self.LOG_VIEW_MAX_LINES)
         layout.addWidget(self.log_text)
 
         # Log controls
@@ -320,6 +347,13 @@ class MainWindow(QMainWindow):
         # Connect scheduler callbacks
         self.scheduler.add_update_callback(self.on_scheduler_update)
 
+        # Show what is already in the log file, then append new records as
+        # they are logged instead of re-reading the file on a timer
+        self.refresh_log()
+        self.log_message.connect(self.log_text.append)
+        self._log_handler = _SignalLogHandler(self.log_message.emit)
+        logging.getLogger().addHandler(self._log_handler)
+
     def setup_timers(self):
         """Setup periodic timers"""
         # System info update timer
@@ -327,11 +361,6 @@ class MainWindow(QMainWindow):
         self.system_timer.timeout.connect(self.refresh_system_info)
         self.system_timer.start(30000)  # Every 30 seconds
 
-        # Log refresh timer
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.refresh_log)
-        self.log_timer.start(5000)  # Every 5 seconds
-
     def load_settings(self):
         """Load settings from configuration"""
         try:
@@ -454,10 +483,11 @@ class MainWindow(QMainWindow):
         try:
             log_file = self.config.get('log_file')
             if log_file and Path(log_file).exists():
-                content = EncodingUtils.read_text_file(log_file)
+                # Cached until the log is written to again
+                content = EncodingUtils.read_text_file(log_file, cache=True)
                 if content:
-                    # Show last 1000 lines
-                    lines = content.split('\n')[-1000:]
+                    # Show the tail that fits in the view
+                    lines = content.split('\n')[-self.LOG_VIEW_MAX_LINES:]
                     self.log_text.setText('\n'.join(lines))
                     # Scroll to bottom
                     cursor = self.log_text.textCursor()
@@ -500,7 +530,12 @@ class MainWindow(QMainWindow):
                 self.tray_icon.show_message("Zed Updater", "应用程序已最小化到托盘")
             event.ignore()
         else:
-            # Cleanup
+            # Cleanup; the embedded updater widget gets no closeEvent of its own
+            logging.getLogger().removeHandler(self._log_handler)
+
+            if self.updater_gui:
+                self.updater_gui.shutdown()
+
             if self.scheduler.is_running():
                 self.scheduler.stop()
 
@@ -178,38 +178,45 @@ class SettingsDialog(QDialog):
     def load_settings(self):
         """Load settings from configuration"""
         try:
+            # Settle writes still waiting on the set() debounce timer so the
+            # dialog starts from what is on disk, then take one consistent
+            # snapshot instead of a config lookup per widget
+            if not self.config.flush():
+                self.logger.warning("Pending configuration changes could not be saved")
+            cfg = self.config.get_all()
+
             # Basic settings
-            self.zed_path_edit.setText(self.config.get('zed_install_path', ''))
-            self.github_repo_edit.setText(self.config.get('github_repo', ''))
+            self.zed_path_edit.setText(cfg.get('zed_install_path', ''))
+            self.github_repo_edit.setText(cfg.get('github_repo', ''))
 
             # Update settings
-            self.auto_check_enabled.setChecked(self.config.get('auto_check_enabled', True))
-            self.check_interval_spin.setValue(self.config.get('check_interval_hours', 24))
-            check_time = self.config.get('check_time', '09:00')
+            self.auto_check_enabled.setChecked(cfg.get('auto_check_enabled', True))
+            self.check_interval_spin.setValue(cfg.get('check_interval_hours', 24))
+            check_time = cfg.get('check_time', '09:00')
             self.check_time_edit.setTime(QTime.fromString(check_time, "hh:mm"))
-            self.check_on_startup.setChecked(self.config.get('check_on_startup', True))
-            self.force_download_latest.setChecked(self.config.get('force_download_latest', True))
+            self.check_on_startup.setChecked(cfg.get('check_on_startup', True))
+            self.force_download_latest.setChecked(cfg.get('force_download_latest', True))
 
             # Action settings
-            self.auto_download.setChecked(self.config.get('auto_download', True))
-            self.auto_install.setChecked(self.config.get('auto_install', False))
-            self.auto_start_after_update.setChecked(self.config.get('auto_start_after_update', True))
-            self.download_timeout_spin.setValue(self.config.get('download_timeout', 300))
-            self.retry_count_spin.setValue(self.config.get('retry_count', 3))
+            self.auto_download.setChecked(cfg.get('auto_download', True))
+            self.auto_install.setChecked(cfg.get('auto_install', False))
+            self.auto_start_after_update.setChecked(cfg.get('auto_start_after_update', True))
+            self.download_timeout_spin.setValue(cfg.get('download_timeout', 300))
+            self.retry_count_spin.setValue(cfg.get('retry_count', 3))
 
             # Backup settings
-            self.backup_enabled.setChecked(self.config.get('backup_enabled', True))
-            self.backup_count_spin.setValue(self.config.get('backup_count', 3))
+            self.backup_enabled.setChecked(cfg.get('backup_enabled', True))
+            self.backup_count_spin.setValue(cfg.get('backup_count', 3))
 
             # Network settings
-            self.proxy_enabled.setChecked(self.config.get('proxy_enabled', False))
-            self.proxy_url_edit.setText(self.config.get('proxy_url', ''))
+            self.proxy_enabled.setChecked(cfg.get('proxy_enabled', False))
+            self.proxy_url_edit.setText(cfg.get('proxy_url', ''))
 
             # UI settings
-            self.minimize_to_tray.setChecked(self.config.get('minimize_to_tray', True))
-            self.start_minimized.setChecked(self.config.get('start_minimized', False))
-            self.notification_enabled.setChecked(self.config.get('notification_enabled', True))
-            self.language_combo.setCurrentText(self.config.get('language', 'zh_CN'))
+            self.minimize_to_tray.setChecked(cfg.get('minimize_to_tray', True))
+            self.start_minimized.setChecked(cfg.get('start_minimized', False))
+            self.notification_enabled.setChecked(cfg.get('notification_enabled', True))
+            self.language_combo.setCurrentText(cfg.get('language', 'zh_CN'))
 
         except Exception as e:
             self.logger.error(f"Failed to load settings: {e}")
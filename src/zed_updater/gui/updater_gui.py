@@ -4,7 +4,9 @@
 Updater GUI component for Zed Updater
 """
 
+import time
 from pathlib import Path
+from datetime import datetime
 from typing import Optional
 
 from PyQt5.QtWidgets import (
@@ -12,7 +14,7 @@ from PyQt5.QtWidgets import (
     QPushButton, QProgressBar, QTextEdit, QGroupBox, QFileDialog,
     QMessageBox, QSplitter
 )
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from ..core.config import ConfigManager
@@ -22,23 +24,64 @@ from ..services.github_api import ReleaseInfo
 from ..utils.logger import get_logger
 
 
-class UpdateWorker(QThread):
-    """Worker thread for update operations"""
+class UpdateWorkerSignals(QObject):
+    """Signals for UpdateWorker; QRunnable is not a QObject and cannot own them"""
 
     progress_updated = pyqtSignal(float, str)
     update_completed = pyqtSignal(bool, str)
     version_info_received = pyqtSignal(object)  # ReleaseInfo
+    finished = pyqtSignal()
+
+
+class UpdateWorker(QRunnable):
+    """Pooled task for update operations"""
+
+    # Minimum seconds between forwarded progress signals (about 30 per second)
+    PROGRESS_INTERVAL = 1 / 30
 
     def __init__(self, updater: ZedUpdater, operation: str):
         super().__init__()
+        # The GUI keeps a reference until `finished`, so Qt must not delete it
+        self.setAutoDelete(False)
+        self.signals = UpdateWorkerSignals()
+        self.progress_updated = self.signals.progress_updated
+        self.update_completed = self.signals.update_completed
+        self.version_info_received = self.signals.version_info_received
         self.updater = updater
         self.operation = operation
         self.release_info = None
+        self._last_progress = -1
+        self._last_message = None
+        self._last_stage = None
+        self._last_emit = 0.0
 
     def set_release_info(self, release_info: ReleaseInfo):
         """Set release info for download/install operations"""
         self.release_info = release_info
 
+    def _report_progress(self, progress: float, message: str):
+        """
+        Forward a progress callback as a signal, throttled
+
+        Each signal queues an event on the GUI thread, so bursts from the
+        download loop are coalesced. Completion, a new stage (the message
+        without its trailing percentage changes) and progress going
+        backwards are always delivered.
+        """
+        now = time.monotonic()
+        percent = int(progress)
+        stage = message.rstrip('0123456789.% ')
+        if progress < 100 and stage == self._last_stage and percent >= self._last_progress:
+            if now - self._last_emit < self.PROGRESS_INTERVAL:
+                return
+            if percent == self._last_progress and message == self._last_message:
+                return
+        self._last_progress = percent
+        self._last_message = message
+        self._last_stage = stage
+        self._last_emit = now
+        self.progress_updated.emit(progress, message)
+
     def run(self):
         """Execute the update operation"""
         try:
@@ -53,6 +96,8 @@ class UpdateWorker(QThread):
 
         except Exception as e:
             self.update_completed.emit(False, f"操作失败: {e}")
+        finally:
+            self.signals.finished.emit()
 
     def _check_version(self):
         """Check for version updates"""
@@ -75,7 +120,7 @@ class UpdateWorker(QThread):
 
         download_path = self.updater.download_update(
             self.release_info,
-            lambda progress, message: self.progress_updated.emit(progress, message)
+            self._report_progress
         )
 
         if download_path:
@@ -112,7 +157,7 @@ class UpdateWorker(QThread):
         self.progress_updated.emit(0, "正在检查更新...")
 
         result = self.updater.check_and_update(
-            lambda progress, message: self.progress_updated.emit(progress, message)
+            self._report_progress
         )
 
         self.update_completed.emit(result.success, result.message)
@@ -121,6 +166,10 @@ class UpdateWorker(QThread):
 class UpdaterGUI(QWidget):
     """Main updater GUI component"""
 
+    # Carries scheduler status changes from the scheduler thread to the GUI
+    # thread as immutable values: (is_running, next_run_time)
+    scheduler_status_changed = pyqtSignal(bool, object)
+
     def __init__(self, config: ConfigManager, updater: ZedUpdater, scheduler: UpdateScheduler):
         super().__init__()
 
@@ -135,6 +184,10 @@ class UpdaterGUI(QWidget):
         self.current_release_info = None
         self.update_worker = None
 
+        # Workers reuse pooled threads instead of creating a QThread per click
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+
         self.init_ui()
         self.setup_connections()
 
@@ -228,14 +281,24 @@ class UpdaterGUI(QWidget):
 
         layout.addWidget(scheduler_group)
 
-        # Update status timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_scheduler_status)
-        self.status_timer.start(5000)  # Update every 5 seconds
-
     def setup_connections(self):
         """Setup signal connections"""
-        pass  # Connections will be established when worker is created
+        # The scheduler reports status changes as they happen, so the labels
+        # no longer need a polling timer
+        self.scheduler_status_changed.connect(self.on_scheduler_status)
+
+        # Copy the fields on the scheduler thread instead of sharing its
+        # mutable status object, and capture only the signal so the callback
+        # keeps no reference to this widget
+        emit = self.scheduler_status_changed.emit
+        self._status_callback = lambda status: emit(status.is_running, status.next_run_time)
+        self.scheduler.add_status_callback(self._status_callback)
+
+        # closeEvent does not run when a parent window deletes this widget,
+        # so also unregister when the underlying QObject is destroyed
+        scheduler, callback = self.scheduler, self._status_callback
+        self.destroyed.connect(lambda *_: scheduler.remove_status_callback(callback))
+        self.update_scheduler_status()
 
     def set_current_version(self, version: str):
         """Set the current version display"""
@@ -244,7 +307,7 @@ class UpdaterGUI(QWidget):
 
     def check_for_updates(self):
         """Check for updates"""
-        if self.update_worker and self.update_worker.isRunning():
+        if self.update_worker:
             QMessageBox.warning(self, "操作进行中", "请等待当前操作完成")
             return
 
@@ -255,7 +318,7 @@ class UpdaterGUI(QWidget):
         self.update_worker.progress_updated.connect(self.on_progress_updated)
         self.update_worker.version_info_received.connect(self.on_version_info_received)
         self.update_worker.update_completed.connect(self.on_update_completed)
-        self.update_worker.start()
+        self._start_worker()
 
     def download_update(self):
         """Download the available update"""
@@ -263,7 +326,7 @@ class UpdaterGUI(QWidget):
             QMessageBox.warning(self, "没有更新", "请先检查更新")
             return
 
-        if self.update_worker and self.update_worker.isRunning():
+        if self.update_worker:
             QMessageBox.warning(self, "操作进行中", "请等待当前操作完成")
             return
 
@@ -274,7 +337,7 @@ class UpdaterGUI(QWidget):
         self.update_worker.set_release_info(self.current_release_info)
         self.update_worker.progress_updated.connect(self.on_progress_updated)
         self.update_worker.update_completed.connect(self.on_update_completed)
-        self.update_worker.start()
+        self._start_worker()
 
     def install_update(self):
         """Install the downloaded update"""
@@ -282,7 +345,7 @@ class UpdaterGUI(QWidget):
             QMessageBox.warning(self, "没有更新", "请先检查更新")
             return
 
-        if self.update_worker and self.update_worker.isRunning():
+        if self.update_worker:
             QMessageBox.warning(self, "操作进行中", "请等待当前操作完成")
             return
 
@@ -302,7 +365,16 @@ class UpdaterGUI(QWidget):
         self.update_worker.set_release_info(self.current_release_info)
         self.update_worker.progress_updated.connect(self.on_progress_updated)
         self.update_worker.update_completed.connect(self.on_update_completed)
-        self.update_worker.start()
+        self._start_worker()
+
+    def _start_worker(self):
+        """Queue self.update_worker on the pool"""
+        self.update_worker.signals.finished.connect(self._on_worker_finished)
+        self.thread_pool.start(self.update_worker)
+
+    def _on_worker_finished(self):
+        """Release the finished worker so a new operation can start"""
+        self.update_worker = None
 
     def start_zed(self):
         """Start Zed application"""
@@ -340,16 +412,19 @@ class UpdaterGUI(QWidget):
 
     def update_scheduler_status(self):
         """Update scheduler status display"""
-        try:
-            status = self.scheduler.get_status()
+        status = self.scheduler.get_status()
+        self.on_scheduler_status(status.is_running, status.next_run_time)
 
-            if status.is_running:
+    def on_scheduler_status(self, is_running: bool, next_run_time: Optional[datetime]):
+        """Handle scheduler status changes"""
+        try:
+            if is_running:
                 self.scheduler_status_label.setText("运行中")
                 self.toggle_scheduler_button.setText("停止定时任务")
 
-                if status.next_run_time:
+                if next_run_time:
                     self.next_run_label.setText(
-                        status.next_run_time.strftime("%Y-%m-%d %H:%M:%S")
+                        next_run_time.strftime("%Y-%m-%d %H:%M:%S")
                     )
                 else:
                     self.next_run_label.setText("未设置")
@@ -413,12 +488,6 @@ class UpdaterGUI(QWidget):
         else:
             QMessageBox.warning(self, "操作失败", message)
 
-        # Clean up worker
-        if self.update_worker:
-            self.update_worker.quit()
-            self.update_worker.wait()
-            self.update_worker = None
-
     def update_progress(self, progress: float, message: str):
         """Update progress display (called from main window)"""
         self.on_progress_updated(progress, message)
@@ -427,9 +496,12 @@ class UpdaterGUI(QWidget):
         """Handle update completion (called from main window)"""
         self.on_update_completed(success, message)
 
+    def shutdown(self):
+        """Stop receiving scheduler status and wait for running workers"""
+        self.scheduler.remove_status_callback(self._status_callback)
+        self.thread_pool.waitForDone()
+
     def closeEvent(self, event):
         """Handle widget close event"""
-        if self.update_worker and self.update_worker.isRunning():
-            self.update_worker.quit()
-            self.update_worker.wait()
+        self.shutdown()
         event.accept()
\ No newline at end of file
@@ -5,19 +5,6 @@ Simplified GUI Main entry point for Zed Updater
 """
 
 import sys
-import os
-
-# Setup UTF-8 environment before any GUI imports
-if sys.platform == 'win32':
-    import locale
-    try:
-        locale.setlocale(locale.LC_ALL, 'Chinese_China.UTF-8')
-    except:
-        try:
-            locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-        except:
-            pass
-    os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton, QTextEdit, QProgressBar, QGroupBox, QHBoxLayout
 from PyQt5.QtCore import Qt, QTimer
@@ -26,6 +13,7 @@ from PyQt5.QtGui import QFont
 from .core.config import ConfigManager
 from .core.updater import ZedUpdater
 from .utils.logger import get_logger
+from .utils.encoding import EncodingUtils
 
 
 class SimpleUpdaterGUI(QMainWindow):
@@ -213,6 +201,9 @@ class SimpleUpdaterGUI(QMainWindow):
 def main():
     """Main GUI entry point"""
     try:
+        # Locale and console encoding must be settled before Qt reads them
+        EncodingUtils.setup_utf8_environment()
+
         # Create Qt application
         app = QApplication(sys.argv)
         
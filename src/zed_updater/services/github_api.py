@@ -4,14 +4,24 @@
 GitHub API service for Zed Updater
 """
 
+import os
+import sys
 import time
+import random
 import hashlib
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..utils.logger import get_logger
 
 
@@ -43,8 +53,10 @@ class GitHubAPI:
     REQUEST_TIMEOUT = 30
     MAX_RETRIES = 3
     RETRY_DELAY = 2
+    MAX_RATE_LIMIT_WAIT = 60
 
-    def __init__(self, repo: str = "TC999/zed-loc", api_url: Optional[str] = None):
+    def __init__(self, repo: str = "TC999/zed-loc", api_url: Optional[str] = None,
+                 token: Optional[str] = None):
         self.logger = get_logger(__name__)
         self.repo = repo
         self.api_base = api_url or self.API_BASE
@@ -54,6 +66,55 @@ class GitHubAPI:
             'Accept': 'application/vnd.github.v3+json'
         })
 
+        # Authenticated requests get a much higher rate limit (5000/h vs 60/h).
+        # Ambient credentials are only sent to the host they were issued for,
+        # so a custom or mirror api_url never receives the user's GitHub token.
+        if not token:
+            api_host = (urlparse(self.api_base).hostname or '').lower()
+            if api_host == 'api.github.com':
+                token = (os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+                         or self._read_gh_cli_token('github.com'))
+            elif api_host:
+                token = self._read_gh_cli_token(api_host)
+        if token:
+            self.session.headers['Authorization'] = f'Bearer {token}'
+
+    def _read_gh_cli_token(self, host: str) -> Optional[str]:
+        """Read the OAuth token the GitHub CLI stored for host, if any"""
+        if os.environ.get('GH_CONFIG_DIR'):
+            config_dir = Path(os.environ['GH_CONFIG_DIR'])
+        elif sys.platform == 'win32' and os.environ.get('APPDATA'):
+            config_dir = Path(os.environ['APPDATA']) / 'GitHub CLI'
+        else:
+            config_dir = Path.home() / '.config' / 'gh'
+
+        hosts_file = config_dir / 'hosts.yml'
+
+        try:
+            content = hosts_file.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+        try:
+            import yaml
+
+            hosts = yaml.safe_load(content) or {}
+            return (hosts.get(host) or {}).get('oauth_token')
+
+        except ImportError:
+            # Minimal fallback for the flat layout written by gh
+            in_host = False
+            for line in content.splitlines():
+                if line and not line[0].isspace():
+                    in_host = line.rstrip().rstrip(':') == host
+                elif in_host and line.strip().startswith('oauth_token:'):
+                    return line.split(':', 1)[1].strip().strip('"\'') or None
+            return None
+
+        except Exception as e:
+            self.logger.debug(f"Failed to read GitHub CLI token: {e}")
+            return None
+
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Make API request with retry logic"""
         url = f"{self.api_base}{endpoint}"
@@ -63,14 +124,26 @@ class GitHubAPI:
                 response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
 
                 if response.status_code == 200:
-                    return response.json()
+                    try:
+                        if orjson is not None:
+                            return orjson.loads(response.content)
+                        return response.json()
+                    except ValueError as e:
+                        # orjson.JSONDecodeError and json.JSONDecodeError are both ValueError;
+                        # an HTML error page or truncated body is retried like a network error
+                        self.logger.warning(f"Invalid JSON response (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
+                        if attempt < self.MAX_RETRIES - 1:
+                            time.sleep(self._backoff_delay(attempt))
+                            continue
+                        self.logger.error(f"Invalid JSON response after {self.MAX_RETRIES} attempts: {url}")
+                        return None
                 elif response.status_code == 404:
                     self.logger.warning(f"Resource not found: {url}")
                     return None
                 elif response.status_code == 403:
                     self.logger.warning(f"Rate limited or forbidden: {url}")
                     if attempt < self.MAX_RETRIES - 1:
-                        time.sleep(self.RETRY_DELAY * (attempt + 1))
+                        time.sleep(self._rate_limit_delay(response, attempt))
                         continue
                     return None
                 else:
@@ -80,7 +153,7 @@ class GitHubAPI:
             except requests.exceptions.RequestException as e:
                 self.logger.warning(f"Request failed (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
                 if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.RETRY_DELAY)
+                    time.sleep(self._backoff_delay(attempt))
                     continue
                 else:
                     self.logger.error(f"Request failed after {self.MAX_RETRIES} attempts: {e}")
@@ -88,6 +161,28 @@ class GitHubAPI:
 
         return None
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter so concurrent clients don't retry in lockstep"""
+        return self.RETRY_DELAY * (2 ** attempt) + random.random()
+
+    def _rate_limit_delay(self, response: requests.Response, attempt: int) -> float:
+        """Compute wait time for a 403 from Retry-After / X-RateLimit-Reset headers"""
+        headers = response.headers
+        wait = None
+
+        try:
+            if headers.get('Retry-After'):
+                wait = float(headers['Retry-After'])
+            elif headers.get('X-RateLimit-Reset'):
+                wait = max(0.0, int(headers['X-RateLimit-Reset']) - time.time())
+        except (TypeError, ValueError):
+            wait = None
+
+        if wait is None:
+            return self._backoff_delay(attempt)
+
+        return min(self.MAX_RATE_LIMIT_WAIT, wait + random.uniform(0, 1))
+
     def get_latest_release(self) -> Optional[ReleaseInfo]:
         """Get latest release information"""
         endpoint = f"/repos/{self.repo}/releases/latest"
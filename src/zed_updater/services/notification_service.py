@@ -5,6 +5,8 @@ Notification service for Zed Updater
 """
 
 import sys
+import shutil
+import subprocess
 from typing import Optional
 from dataclasses import dataclass
 
@@ -23,11 +25,26 @@ class NotificationConfig:
 class NotificationService:
     """Service for handling notifications across platforms"""
 
+    # External helpers used for notifications and sounds on macOS/Linux
+    EXTERNAL_COMMANDS = ('notify-send', 'osascript', 'paplay', 'play', 'afplay')
+
     def __init__(self, config: Optional[NotificationConfig] = None):
         self.logger = get_logger(__name__)
         self.config = config or NotificationConfig()
         self._tray_icon = None
 
+        # Resolve helper binaries once instead of searching PATH on every call
+        self._cmd_paths = {name: shutil.which(name) for name in self.EXTERNAL_COMMANDS}
+
+    def _run_command(self, name: str, args: list, **kwargs) -> bool:
+        """Run a pre-resolved external command, returning False if it is unavailable"""
+        path = self._cmd_paths.get(name)
+        if not path:
+            return False
+
+        subprocess.run([path, *args], stdin=subprocess.DEVNULL, capture_output=True, **kwargs)
+        return True
+
     def set_tray_icon(self, tray_icon) -> None:
         """Set the system tray icon for notifications"""
         self._tray_icon = tray_icon
@@ -99,12 +116,9 @@ class NotificationService:
     def _show_macos_notification(self, title: str, message: str, icon_type: str) -> None:
         """Show notification on macOS"""
         try:
-            import subprocess
-            import shlex
-
             # Use osascript for notifications
             script = f'display notification "{message}" with title "{title}"'
-            subprocess.run(['osascript', '-e', script], capture_output=True)
+            self._run_command('osascript', ['-e', script])
 
         except Exception as e:
             self.logger.warning(f"macOS notification failed: {e}")
@@ -112,21 +126,17 @@ class NotificationService:
     def _show_linux_notification(self, title: str, message: str, icon_type: str) -> None:
         """Show notification on Linux"""
         try:
-            import subprocess
-
             # Try notify-send
             icon = self._get_icon_name(icon_type)
-            subprocess.run([
-                'notify-send',
+            sent = self._run_command('notify-send', [
                 '--icon', icon,
                 '--expire-time', '5000',
                 title,
                 message
-            ], capture_output=True)
+            ])
 
-        except (ImportError, FileNotFoundError):
-            # Fallback to system tray
-            if self._tray_icon:
+            if not sent and self._tray_icon:
+                # Fallback to system tray
                 self._show_tray_notification(title, message, icon_type)
 
         except Exception as e:
@@ -192,22 +202,20 @@ class NotificationService:
     def _play_macos_sound(self, sound_type: str) -> None:
         """Play sound on macOS"""
         try:
-            import subprocess
-            subprocess.run(['afplay', '/System/Library/Sounds/Ping.aiff'], capture_output=True)
+            self._run_command('afplay', ['/System/Library/Sounds/Ping.aiff'])
         except Exception:
             pass
 
     def _play_linux_sound(self, sound_type: str) -> None:
         """Play sound on Linux"""
         try:
-            import subprocess
             # Try different sound commands
-            for cmd in [['paplay', '/usr/share/sounds/freedesktop/stereo/message.oga'],
-                       ['play', '-q', '/usr/share/sounds/alsa/Front_Center.wav']]:
+            for name, args in [('paplay', ['/usr/share/sounds/freedesktop/stereo/message.oga']),
+                               ('play', ['-q', '/usr/share/sounds/alsa/Front_Center.wav'])]:
                 try:
-                    subprocess.run(cmd, capture_output=True, timeout=2)
-                    break
-                except (subprocess.TimeoutExpired, FileNotFoundError):
+                    if self._run_command(name, args, timeout=2):
+                        break
+                except subprocess.TimeoutExpired:
                     continue
         except Exception:
-            pass
\ No newline at end of file
+            pass
@@ -5,6 +5,9 @@ System service for Zed Updater - handles system operations
 """
 
 import os
+import stat
+import time
+import shutil
 import platform
 import psutil
 from typing import Dict, Any, Optional
@@ -18,6 +21,7 @@ class SystemService:
 
     def __init__(self):
         self.logger = get_logger(__name__)
+        self._boot_time: Optional[float] = None
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get comprehensive system information"""
@@ -60,7 +64,7 @@ class SystemService:
                 'disk_total_gb': disk.total / (1024**3),
                 'network_connections': len(psutil.net_connections()),
                 'running_processes': len(list(psutil.process_iter())),
-                'timestamp': psutil.time.time()
+                'timestamp': time.time()
             }
 
             return status
@@ -101,7 +105,10 @@ class SystemService:
     def _get_system_uptime(self) -> float:
         """Get system uptime in seconds"""
         try:
-            return psutil.time.time() - psutil.boot_time()
+            # Boot time is fixed for the life of the process (suspend/resume aside)
+            if self._boot_time is None:
+                self._boot_time = psutil.boot_time()
+            return time.time() - self._boot_time
         except Exception:
             return 0.0
 
@@ -179,22 +186,9 @@ class SystemService:
     def get_available_space(self, path: str = ".") -> Optional[int]:
         """Get available disk space in bytes"""
         try:
-            stat = os.statvfs(path)
-            return stat.f_bavail * stat.f_frsize
-        except (OSError, AttributeError):
-            # Windows fallback
-            try:
-                import ctypes
-                free_bytes = ctypes.c_ulonglong(0)
-                ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                    ctypes.c_wchar_p(path),
-                    None,
-                    None,
-                    ctypes.pointer(free_bytes)
-                )
-                return free_bytes.value
-            except Exception:
-                return None
+            return shutil.disk_usage(path).free
+        except (OSError, ValueError):
+            return None
 
     def ensure_directory(self, path: str) -> bool:
         """Ensure directory exists"""
@@ -206,21 +200,24 @@ class SystemService:
             return False
 
     def get_file_info(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Get file information"""
-        try:
-            path = Path(file_path)
-            if not path.exists():
-                return None
+        """Get file information
 
-            stat = path.stat()
-            return {
-                'path': str(path.absolute()),
-                'size': stat.st_size,
-                'modified': stat.st_mtime,
-                'created': stat.st_ctime,
-                'is_file': path.is_file(),
-                'is_dir': path.is_dir()
-            }
+        Uses a single ``os.stat`` call. Note that ``created`` is ``st_ctime``,
+        which on Linux is the inode change time rather than creation time.
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             self.logger.error(f"Failed to get file info for {file_path}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+        return {
+            'path': os.path.abspath(file_path),
+            'size': st.st_size,
+            'modified': st.st_mtime,
+            'created': st.st_ctime,
+            'is_file': stat.S_ISREG(st.st_mode),
+            'is_dir': stat.S_ISDIR(st.st_mode)
+        }
\ No newline at end of file
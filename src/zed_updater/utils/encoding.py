@@ -6,26 +6,97 @@ Encoding utilities for handling UTF-8 and cross-platform text operations
 
 import os
 import sys
+import mmap
+import stat
+import io
+import codecs
+import shutil
 import locale
-import chardet
+import threading
+import functools
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, Iterable, Iterator
+
+# Parent directories already created or found by _atomic_write
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path, refresh: bool = False) -> None:
+    """mkdir -p, skipping the syscalls for directories seen before"""
+    if not refresh and path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(path)
 
 
 class EncodingUtils:
     """Utilities for handling text encoding across platforms"""
 
+    # Number of leading bytes sampled for encoding detection
+    DETECT_SAMPLE_SIZE = 8192
+
+    # Files at least this large are decoded straight from a read-only memory map
+    MMAP_THRESHOLD = 64 * 1024
+
+    # Initial chunk size and growth cutoff for streams of unknown size
+    READ_CHUNK_SIZE = 128 * 1024
+    READ_GROWTH_CUTOFF = 4 * 1024 * 1024
+
+    # Bytes decoded per step by iter_text_file
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Largest file read_text_file loads by default; use iter_text_file beyond
+    MAX_TEXT_BYTES = 64 * 1024 * 1024
+
+    # Largest file whose decoded text read_text_file(cache=True) keeps
+    CACHE_MAX_BYTES = 1024 * 1024
+
+    # Fallback order for safe_decode; latin-1 never fails. Plain utf-8 keeps
+    # a leading BOM as U+FEFF so decoded bytes round-trip unchanged, and a
+    # separate utf-8-sig attempt could never be reached after it
+    SAFE_DECODE_CODECS = ('utf-8', 'gbk', 'latin-1')
+
+    # Codec registry lookups resolved once instead of on every decode attempt
+    _SAFE_DECODE_INFOS = tuple(codecs.lookup(name) for name in SAFE_DECODE_CODECS)
+    _UTF8_INCREMENTAL = codecs.getincrementaldecoder('utf-8')
+    _GBK_INCREMENTAL = codecs.getincrementaldecoder('gbk')
+
+    # Byte order marks and the codec that consumes each one. The UTF-32 LE
+    # mark begins with the UTF-16 LE one, so it has to be checked first
+    BOM_CODECS = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def setup_utf8_environment() -> None:
-        """Setup UTF-8 environment for cross-platform compatibility"""
+        """
+        Setup UTF-8 environment for cross-platform compatibility
+
+        Runs once per process and only when an entry point asks for it, never
+        at import. Setting ZED_UPDATER_SETUP_UTF8=0 leaves the process
+        environment, locale and standard streams untouched.
+        """
+        if os.environ.get('ZED_UPDATER_SETUP_UTF8') == '0':
+            return
+
         # Set environment variables
         os.environ['PYTHONIOENCODING'] = 'utf-8'
 
         # Windows specific setup
         if sys.platform == 'win32':
             try:
-                # Try to set console codepage to UTF-8
-                os.system('chcp 65001 > nul 2>&1')
+                # Set console code pages to UTF-8 directly instead of spawning chcp
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetConsoleOutputCP(65001)
+                kernel32.SetConsoleCP(65001)
             except:
                 pass
 
@@ -46,18 +117,22 @@ class EncodingUtils:
             except Exception:
                 pass
 
+        # The preferred encoding may have changed with the locale
+        EncodingUtils.get_system_encoding.cache_clear()
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_system_encoding() -> str:
-        """Get the system's preferred encoding"""
+        """Get the system's preferred encoding (cached for the process lifetime)"""
         try:
             return locale.getpreferredencoding()
         except:
             return 'utf-8'
 
     @staticmethod
-    def detect_file_encoding(file_path: Union[str, Path], sample_size: int = 8192) -> str:
+    def detect_file_encoding(file_path: Union[str, Path], sample_size: int = DETECT_SAMPLE_SIZE) -> str:
         """
-        Detect file encoding using chardet
+        Detect file encoding (BOM-marked Unicode, UTF-8 or GBK)
 
         Args:
             file_path: Path to the file
@@ -66,68 +141,229 @@ class EncodingUtils:
         Returns:
             Detected encoding string
         """
-        file_path = Path(file_path)
+        # Results are cached per (path, mtime, size), so an unchanged file is
+        # only sampled once
+        try:
+            st = os.stat(file_path)
+        except Exception:
+            return 'utf-8'
+        return EncodingUtils._detect_cached(
+            os.path.abspath(file_path), st.st_mtime_ns, st.st_size, sample_size
+        )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _detect_cached(path: str, mtime_ns: int, size: int, sample_size: int) -> str:
+        """Sample and detect a file; the stat fields only serve as cache key"""
         try:
-            with open(file_path, 'rb') as f:
+            with open(path, 'rb') as f:
                 raw_data = f.read(sample_size)
+        except Exception:
+            return 'utf-8'
 
-            result = chardet.detect(raw_data)
-            encoding = result.get('encoding', 'utf-8')
-
-            # Handle common encoding aliases
-            if encoding:
-                encoding = encoding.lower()
-                if encoding in ['utf-8-sig', 'utf-8']:
-                    return 'utf-8-sig' if raw_data.startswith(b'\xef\xbb\xbf') else 'utf-8'
-                elif encoding in ['gbk', 'gb2312', 'cp936']:
-                    return 'gbk'
+        return EncodingUtils._detect_from_bytes(raw_data)
 
-            return 'utf-8'  # Default fallback
+    @staticmethod
+    def _detect_from_bytes(raw_data: bytes) -> str:
+        """Detect the encoding of an in-memory byte sample"""
+        # BOM-marked Unicode; a mark settles the question without decoding
+        for bom, encoding in EncodingUtils.BOM_CODECS:
+            if raw_data.startswith(bom):
+                return encoding
+
+        # ASCII is valid UTF-8; bytes.isascii() scans a word at a time in C
+        if raw_data.isascii():
+            return 'utf-8'
 
-        except Exception:
+        # The sample may end mid-character, so validate incrementally
+        # and let the last partial sequence through
+        try:
+            EncodingUtils._UTF8_INCREMENTAL().decode(raw_data)
             return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+
+        try:
+            EncodingUtils._GBK_INCREMENTAL().decode(raw_data)
+            return 'gbk'
+        except UnicodeDecodeError:
+            return 'utf-8'  # Default fallback; readers decode with replacement
 
     @staticmethod
-    def read_text_file(file_path: Union[str, Path], encoding: Optional[str] = None) -> Optional[str]:
+    def read_text_file(
+        file_path: Union[str, Path],
+        encoding: Optional[str] = None,
+        cache: bool = False,
+        max_size: Optional[int] = MAX_TEXT_BYTES
+    ) -> Optional[str]:
         """
         Safely read text file with encoding detection
 
+        The file is opened once; detection runs on the leading bytes of the
+        same buffer that is then decoded.
+
         Args:
             file_path: Path to the file
             encoding: Optional encoding override
+            cache: Reuse the previous result while the file's mtime and size
+                are unchanged (regular files up to CACHE_MAX_BYTES only)
+            max_size: Refuse regular files larger than this many bytes
+                instead of loading them whole; None disables the limit
 
         Returns:
-            File content as string, or None if failed
+            File content as string, or None if failed or too large
         """
-        file_path = Path(file_path)
+        if cache:
+            try:
+                st = os.stat(file_path)
+                if max_size is not None and st.st_size > max_size:
+                    return None
+                # Size 0 also covers pseudo-files whose size says nothing
+                if stat.S_ISREG(st.st_mode) and 0 < st.st_size <= EncodingUtils.CACHE_MAX_BYTES:
+                    return EncodingUtils._read_cached(
+                        os.path.abspath(file_path), st.st_mtime_ns, st.st_size, encoding
+                    )
+            except OSError:
+                return None
+
+        return EncodingUtils._read_text(file_path, encoding, max_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _read_cached(path: str, mtime_ns: int, size: int, encoding: Optional[str]) -> str:
+        """Cached read_text_file; failures raise so they are never cached"""
+        text = EncodingUtils._read_text(path, encoding, None)
+        if text is None:
+            raise OSError(f"cannot read {path}")
+        return text
 
-        if not file_path.exists():
+    @staticmethod
+    def _read_text(
+        file_path: Union[str, Path],
+        encoding: Optional[str],
+        max_size: Optional[int]
+    ) -> Optional[str]:
+        """Uncached body of read_text_file"""
+        try:
+            # Unbuffered: every read below is large enough that a userspace
+            # buffer would only add a copy
+            with open(file_path, 'rb', buffering=0) as f:
+                st = os.fstat(f.fileno())
+                if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                    # Pipes and pseudo-files (e.g. /proc) report no usable size
+                    data = EncodingUtils._readall(f)
+                elif max_size is not None and st.st_size > max_size:
+                    return None
+                elif st.st_size >= EncodingUtils.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if encoding is None:
+                            encoding = EncodingUtils._detect_from_bytes(
+                                mm[:EncodingUtils.DETECT_SAMPLE_SIZE]
+                            )
+                        return EncodingUtils._decode_text(mm, encoding)
+                else:
+                    data = f.read()
+        except Exception:
             return None
 
         # Detect encoding if not provided
         if encoding is None:
-            encoding = EncodingUtils.detect_file_encoding(file_path)
+            encoding = EncodingUtils._detect_from_bytes(data[:EncodingUtils.DETECT_SAMPLE_SIZE])
 
-        # Try reading with detected encoding
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Fallback to UTF-8
+            return EncodingUtils._decode_text(data, encoding)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _readall(f) -> bytes:
+        """
+        Read a stream of unknown size to EOF
+
+        Chunks start at READ_CHUNK_SIZE and grow threefold until
+        READ_GROWTH_CUTOFF bytes have been read, then by 1/8 per read.
+        """
+        chunks = []
+        total = 0
+        size = EncodingUtils.READ_CHUNK_SIZE
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+            if total < EncodingUtils.READ_GROWTH_CUTOFF:
+                size *= 3
+            else:
+                size += size >> 3
+        return b''.join(chunks)
+
+    @staticmethod
+    def _decode_text(data, encoding: str) -> Optional[str]:
+        """
+        Decode a bytes-like buffer the way text-mode open() would
+
+        Falls back to UTF-8 and then latin-1 (lossless) on decode errors, and
+        applies universal newline translation.
+        """
+        for candidate in (encoding, 'utf-8', 'latin-1'):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+                # str() decodes directly from the buffer without an extra bytes copy
+                text = str(data, candidate)
+                break
             except UnicodeDecodeError:
-                # Final fallback to latin-1 (lossless)
-                try:
-                    with open(file_path, 'r', encoding='latin-1') as f:
-                        return f.read()
-                except Exception:
-                    return None
-        except Exception:
+                continue
+        else:
             return None
 
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    @staticmethod
+    def iter_text_file(
+        file_path: Union[str, Path],
+        encoding: Optional[str] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Yield a text file's content as decoded chunks
+
+        Memory stays bounded by chunk_size whatever the file size. Newlines
+        are translated as in text mode, including CRLF pairs split across
+        chunks. Unlike read_text_file there is no lossy fallback.
+
+        Args:
+            file_path: Path to the file
+            encoding: Optional encoding override
+            chunk_size: Number of bytes decoded per step
+
+        Yields:
+            Decoded text chunks
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the content is not valid in the encoding
+        """
+        if encoding is None:
+            encoding = EncodingUtils.detect_file_encoding(file_path)
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+
+        with open(file_path, 'rb') as f:
+            while True:
+                raw = f.read(chunk_size)
+                if not raw:
+                    break
+                text = decoder.decode(raw)
+                if text:
+                    yield text
+
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
     @staticmethod
     def write_text_file(file_path: Union[str, Path], content: str, encoding: str = 'utf-8-sig') -> bool:
         """
@@ -141,27 +377,97 @@ class EncodingUtils:
         Returns:
             True if successful, False otherwise
         """
+        try:
+            # Encode once up front (matching text-mode newline translation)
+            # and write the bytes directly, bypassing TextIOWrapper
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            EncodingUtils._atomic_write(file_path, (content.encode(encoding),))
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _atomic_write(file_path: Union[str, Path], blocks: Iterable[bytes], backup: bool = True) -> None:
+        """
+        Replace file_path with the concatenated blocks
+
+        Unless backup is False, the previous version, if any, is kept as
+        <name>.backup. The backup is a hard link sharing the old file's
+        inode, which is only safe because every writer of these files goes
+        through this replace and none modifies them in place. The target's
+        permission bits are preserved. Raises on failure, leaving the
+        target untouched.
+        """
         file_path = Path(file_path)
+        temp_path = None
 
         try:
             # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(file_path.parent)
 
-            # Write with backup
-            if file_path.exists():
+            # Write to a sibling temp file first so the target is never left
+            # truncated or missing if the write is interrupted
+            temp_path = file_path.with_name(
+                f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+
+            # The replace swaps in the temp file's permissions, so carry the
+            # target's over; creating with them keeps e.g. a 0600 file's new
+            # content from ever being readable more widely
+            try:
+                target_mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                target_mode = None
+            create_mode = 0o666 if target_mode is None else target_mode
+
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            try:
+                fd = os.open(temp_path, flags, create_mode)
+            except FileNotFoundError:
+                # The directory was removed after it was cached; recreate it
+                _ensure_dir(file_path.parent, refresh=True)
+                fd = os.open(temp_path, flags, create_mode)
+            try:
+                for block in blocks:
+                    data = memoryview(block)
+                    while data:
+                        data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # os.open masked the mode with the umask; restore it exactly
+            if target_mode is not None:
+                os.chmod(temp_path, target_mode)
+
+            # Keep the previous version as a backup. The replace below gives
+            # file_path a new inode, so a hard link to the old one keeps the
+            # previous content (and mode) without copying any bytes
+            if backup and target_mode is not None:
                 backup_path = file_path.with_suffix(file_path.suffix + '.backup')
                 try:
-                    file_path.replace(backup_path)
+                    try:
+                        os.unlink(backup_path)
+                    except FileNotFoundError:
+                        pass
+                    try:
+                        os.link(file_path, backup_path)
+                    except OSError:
+                        # No hard links here (FAT, some network shares)
+                        shutil.copy2(file_path, backup_path)
                 except Exception:
                     pass  # Continue without backup if it fails
 
-            with open(file_path, 'w', encoding=encoding) as f:
-                f.write(content)
-
-            return True
+            os.replace(temp_path, file_path)
 
-        except Exception:
-            return False
+        except BaseException:
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            raise
 
     @staticmethod
     def normalize_text(text: str) -> str:
@@ -177,11 +483,12 @@ class EncodingUtils:
         if not isinstance(text, str):
             return str(text)
 
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        # Normalize line endings; the membership test avoids copying LF-only text
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
 
         # Strip BOM if present
-        if text.startswith('\ufeff'):
+        if text[:1] == '\ufeff':
             text = text[1:]
 
         return text
@@ -198,13 +505,15 @@ class EncodingUtils:
         Returns:
             Encoded bytes
         """
+        # The strict encode is CPython's fast path (a plain copy for ASCII);
+        # the handlers only run when it fails
         try:
             return text.encode(target_encoding)
         except UnicodeEncodeError:
-            # Fallback to UTF-8
-            return text.encode('utf-8')
+            # Fallback to UTF-8; only lone surrogates need replacing there
+            return text.encode('utf-8', errors='replace')
         except Exception:
-            return str(text).encode('utf-8')
+            return str(text).encode('utf-8', errors='replace')
 
     @staticmethod
     def safe_decode(data: bytes, source_encoding: Optional[str] = None) -> str:
@@ -224,12 +533,14 @@ class EncodingUtils:
             except UnicodeDecodeError:
                 pass
 
-        # Auto-detection fallback
-        encodings_to_try = ['utf-8', 'utf-8-sig', 'gbk', 'latin-1']
+        # Pure ASCII is valid UTF-8; skip the fallback chain entirely
+        if data.isascii():
+            return data.decode('ascii')
 
-        for encoding in encodings_to_try:
+        # Auto-detection fallback: one attempt per codec family
+        for codec in EncodingUtils._SAFE_DECODE_INFOS:
             try:
-                return data.decode(encoding)
+                return codec.decode(data)[0]
             except UnicodeDecodeError:
                 continue
 
@@ -256,6 +567,20 @@ class EncodingUtils:
         source_path = Path(source_path)
         target_path = Path(target_path)
 
+        # Stream chunk by chunk so large files are never held in memory whole
+        try:
+            EncodingUtils._atomic_write(
+                target_path,
+                EncodingUtils._encode_chunks(
+                    EncodingUtils.iter_text_file(source_path), target_encoding
+                )
+            )
+            return True
+        except UnicodeDecodeError:
+            pass  # Mixed or mis-detected encoding: use the lenient path below
+        except Exception:
+            return False
+
         # Read source file
         content = EncodingUtils.read_text_file(source_path)
         if content is None:
@@ -264,6 +589,16 @@ class EncodingUtils:
         # Write with new encoding
         return EncodingUtils.write_text_file(target_path, content, target_encoding)
 
+    @staticmethod
+    def _encode_chunks(chunks: Iterable[str], encoding: str) -> Iterator[bytes]:
+        """Encode text chunks as write_text_file would, emitting any BOM once"""
+        encoder = codecs.getincrementalencoder(encoding)()
+        for chunk in chunks:
+            if os.linesep != '\n':
+                chunk = chunk.replace('\n', os.linesep)
+            yield encoder.encode(chunk)
+        yield encoder.encode('', final=True)
+
     @staticmethod
     def is_utf8_compatible(text: str) -> bool:
         """
@@ -273,10 +608,37 @@ class EncodingUtils:
             text: Text to check
 
         Returns:
-            True if UTF-8 compatible
+            True if UTF-8 compatible (False for non-str input)
         """
+        if not isinstance(text, str):
+            return False
+
+        # str.isascii() reads a flag cached on the string object
+        if text.isascii():
+            return True
+
         try:
             text.encode('utf-8')
             return True
         except UnicodeEncodeError:
+            return False
+
+    @staticmethod
+    def is_utf8_compatible_bytes(data: bytes) -> bool:
+        """
+        Check if raw bytes are valid UTF-8
+
+        Args:
+            data: Bytes to check
+
+        Returns:
+            True if the bytes decode as UTF-8
+        """
+        if data.isascii():
+            return True
+
+        try:
+            data.decode('utf-8')
+            return True
+        except UnicodeDecodeError:
             return False
\ No newline at end of file
@@ -5,14 +5,45 @@ Error handling utilities for Zed Updater
 """
 
 import sys
-import traceback
+import time
 from typing import Callable, Any, Optional
-from functools import wraps
+from functools import wraps, lru_cache
 
 from ..utils.logger import get_logger
+from ..core import exceptions
 from ..core.exceptions import ZedUpdaterError
 
 
+# User-facing messages keyed by exception class, resolved via the error's MRO
+_ERROR_MESSAGES = {
+    exceptions.NetworkError: "网络连接错误，请检查网络连接和代理设置",
+    exceptions.DownloadError: "下载文件时出错，请检查网络连接",
+    exceptions.InstallationError: "安装更新时出错，请检查文件权限",
+    exceptions.ValidationError: "数据验证失败，请检查配置",
+    exceptions.ConfigurationError: "配置错误，请检查配置文件",
+    exceptions.PermissionError: "权限不足，请以管理员身份运行",
+    exceptions.TimeoutError: "操作超时，请重试",
+}
+
+_OS_ERRNO_MESSAGES = {
+    1: "权限被拒绝，请检查文件权限",  # Operation not permitted
+    2: "文件或目录不存在",  # No such file or directory
+    28: "磁盘空间不足",  # No space left on device
+}
+
+
+def _format_os_error(error: OSError) -> str:
+    """Get message for an OSError based on its errno"""
+    return _OS_ERRNO_MESSAGES.get(error.errno) or f"系统错误: {error.strerror}"
+
+
+# Messages that depend on attributes of the exception instance
+_ERROR_FORMATTERS = {
+    exceptions.FileOperationError: lambda error: f"文件操作失败: {error.file_path}",
+    OSError: _format_os_error,
+}
+
+
 class ErrorHandler:
     """Centralized error handling"""
 
@@ -38,9 +69,9 @@ class ErrorHandler:
         else:
             full_msg = error_msg
 
-        # Log the full error with traceback
-        self.logger.error(f"Error in {context}: {error}")
-        self.logger.debug(f"Traceback: {traceback.format_exc()}")
+        # Log the full error; the traceback is only formatted if DEBUG is emitted
+        self.logger.error("Error in %s: %s", context, error)
+        self.logger.debug("Traceback:", exc_info=error)
 
         if show_user:
             return self._format_user_message(full_msg)
@@ -49,45 +80,28 @@ class ErrorHandler:
 
     def _get_error_message(self, error: Exception) -> str:
         """Get appropriate error message for different exception types"""
-        from ..core.exceptions import (
-            NetworkError, DownloadError, InstallationError,
-            ValidationError, ConfigurationError, PermissionError,
-            TimeoutError, FileOperationError
-        )
-
-        if isinstance(error, NetworkError):
-            return "网络连接错误，请检查网络连接和代理设置"
-        elif isinstance(error, DownloadError):
-            return "下载文件时出错，请检查网络连接"
-        elif isinstance(error, InstallationError):
-            return "安装更新时出错，请检查文件权限"
-        elif isinstance(error, ValidationError):
-            return "数据验证失败，请检查配置"
-        elif isinstance(error, ConfigurationError):
-            return "配置错误，请检查配置文件"
-        elif isinstance(error, PermissionError):
-            return "权限不足，请以管理员身份运行"
-        elif isinstance(error, TimeoutError):
-            return "操作超时，请重试"
-        elif isinstance(error, FileOperationError):
-            return f"文件操作失败: {error.file_path}"
-        elif isinstance(error, OSError):
-            if error.errno == 1:  # Operation not permitted
-                return "权限被拒绝，请检查文件权限"
-            elif error.errno == 2:  # No such file or directory
-                return "文件或目录不存在"
-            elif error.errno == 28:  # No space left on device
-                return "磁盘空间不足"
-            else:
-                return f"系统错误: {error.strerror}"
-        else:
-            return f"未知错误: {str(error)}"
+        for cls in type(error).__mro__:
+            formatter = _ERROR_FORMATTERS.get(cls)
+            if formatter is not None:
+                return formatter(error)
+
+            message = _ERROR_MESSAGES.get(cls)
+            if message is not None:
+                return message
+
+        return f"未知错误: {str(error)}"
 
     def _format_user_message(self, message: str) -> str:
         """Format message for user display"""
         return message
 
 
+@lru_cache(maxsize=1)
+def _get_default_handler() -> ErrorHandler:
+    """Get the shared ErrorHandler used by the decorators in this module"""
+    return ErrorHandler()
+
+
 def error_handler(context: str = "", show_user: bool = True):
     """
     Decorator for error handling
@@ -99,11 +113,10 @@ def error_handler(context: str = "", show_user: bool = True):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            handler = ErrorHandler()
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                error_msg = handler.handle_error(e, context, show_user)
+                error_msg = _get_default_handler().handle_error(e, context, show_user)
                 # Re-raise ZedUpdaterError types, convert others
                 if isinstance(e, ZedUpdaterError):
                     raise
@@ -126,11 +139,10 @@ def safe_call(func: Callable, *args, default: Any = None, **kwargs) -> Any:
     Returns:
         Function result or default value
     """
-    handler = ErrorHandler()
     try:
         return func(*args, **kwargs)
     except Exception as e:
-        handler.handle_error(e, f"safe_call({func.__name__})", show_user=False)
+        _get_default_handler().handle_error(e, f"safe_call({func.__name__})", show_user=False)
         return default
 
 
@@ -150,8 +162,8 @@ def log_exceptions(logger=None):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Exception in {func.__name__}: {e}")
-                logger.debug(f"Traceback: {traceback.format_exc()}")
+                logger.error("Exception in %s: %s", func.__name__, e)
+                logger.debug("Traceback:", exc_info=e)
                 return None
         return wrapper
     return decorator
@@ -169,7 +181,7 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, backoff: float =
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            handler = ErrorHandler()
+            handler = _get_default_handler()
             current_delay = delay
 
             for attempt in range(max_attempts):
@@ -182,7 +194,6 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, backoff: float =
                             f"Attempt {attempt + 1} failed for {func.__name__}, retrying in {current_delay}s",
                             show_user=False
                         )
-                        import time
                         time.sleep(current_delay)
                         current_delay *= backoff
                     else:
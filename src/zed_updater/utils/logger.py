@@ -5,13 +5,85 @@ Logger utility for Zed Updater with UTF-8 support and structured logging
 """
 
 import sys
+import time
+import queue
+import atexit
 import logging
+import functools
 import logging.handlers
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
+def _supports_color() -> bool:
+    """Check if terminal supports colors (cached for the process lifetime)"""
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            return kernel32.GetConsoleMode(kernel32.GetStdHandle(-11)) != 0
+        except:
+            return False
+    else:
+        return sys.stdout.isatty()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves traceback formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now so later mutation by the caller can't change the message,
+        # but keep exc_info so the traceback is only rendered on the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the logging listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each wall-clock second's timestamp only once"""
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        # (second, formatted) pair, swapped as one object so readers on
+        # other threads never see a mismatched second and string
+        self._cached_time = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+
 class UTF8Formatter(logging.Formatter):
     """Custom formatter with UTF-8 and color support"""
 
@@ -24,38 +96,38 @@ class UTF8Formatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
 
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
     def __init__(self, use_colors: bool = True, include_timestamp: bool = True):
         super().__init__()
         self.use_colors = use_colors and self._supports_color()
         self.include_timestamp = include_timestamp
 
-    def _supports_color(self) -> bool:
-        """Check if terminal supports colors"""
-        if sys.platform == 'win32':
-            try:
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                return kernel32.GetConsoleMode(kernel32.GetStdHandle(-11)) != 0
-            except:
-                return False
-        else:
-            return sys.stdout.isatty()
-
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with UTF-8 and optional colors"""
         # Create base format
         if self.include_timestamp:
             base_format = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
         else:
             base_format = '%(levelname)s - %(name)s - %(message)s'
 
-        # Apply color if supported
-        if self.use_colors and record.levelname in self.COLORS:
-            colored_format = f"{self.COLORS[record.levelname]}{base_format}{self.COLORS['RESET']}"
-            formatter = logging.Formatter(colored_format, datefmt='%Y-%m-%d %H:%M:%S')
-        else:
-            formatter = logging.Formatter(base_format, datefmt='%Y-%m-%d %H:%M:%S')
+        # Build formatters once instead of on every record
+        self._plain_formatter = _CachedTimeFormatter(base_format, datefmt=self.DATE_FORMAT)
+        self._level_formatters = {}
+        if self.use_colors:
+            for level_name, color in self.COLORS.items():
+                if level_name == 'RESET':
+                    continue
+                colored_format = f"{color}{base_format}{self.COLORS['RESET']}"
+                self._level_formatters[level_name] = _CachedTimeFormatter(
+                    colored_format, datefmt=self.DATE_FORMAT
+                )
+
+    def _supports_color(self) -> bool:
+        """Check if terminal supports colors"""
+        return _supports_color()
 
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record with UTF-8 and optional colors"""
+        formatter = self._level_formatters.get(record.levelname, self._plain_formatter)
         return formatter.format(record)
 
 
@@ -79,15 +151,21 @@ def setup_logging(
     Returns:
         Root logger instance
     """
+    global _queue_listener
+
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
     # Set level
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    numeric_level = _LEVELS.get(level.upper(), logging.INFO)
     root_logger.setLevel(numeric_level)
 
+    # Drop debug records process-wide before any logger or handler sees them
+    logging.disable(logging.NOTSET if numeric_level <= logging.DEBUG else logging.DEBUG)
+
     # Create formatter
     formatter = UTF8Formatter(use_colors=use_colors)
 
@@ -95,7 +173,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if specified)
     if log_file:
@@ -111,7 +189,16 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Formatting, colouring and file rotation run on the listener thread;
+    # logging callers only enqueue the record
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
 
     return root_logger
 
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pytest 全局配置：测试期间禁止真实网络连接
+"""
+
+import pytest
+
+# pytest-socket 只是开发依赖；未安装时测试照常运行，只是不拦截网络
+try:
+    import pytest_socket
+except ImportError:
+    pytest_socket = None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_setup(item):
+    """每个测试开始前禁止socket，漏掉的mock立即失败而不是等待TCP超时"""
+    if pytest_socket is None or item.get_closest_marker('enable_socket'):
+        return
+    pytest_socket.disable_socket(allow_unix_socket=True)
@@ -7,13 +7,15 @@ Zed Updater 集成测试
 
 import unittest
 import tempfile
-import shutil
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock, patch, MagicMock
 import time
 import subprocess
+import threading
+import uuid
 
 # 添加项目路径
 project_root = Path(__file__).parent.parent
@@ -24,12 +26,49 @@ from updater.updater import ZedUpdater
 from updater.scheduler import UpdateScheduler
 
 
-class TestEndToEndUpdate(unittest.TestCase):
+def _under_coverage():
+    """是否有跟踪器正在运行；只看实际生效的跟踪器，不看命令行参数或环境变量"""
+    if sys.gettrace() is not None:
+        return True
+    # Python 3.12+ 上coverage可能使用sys.monitoring，此时gettrace()为None
+    try:
+        import coverage
+    except ImportError:
+        return False
+    return coverage.Coverage.current() is not None
+
+# GitHub release API响应样例，只读，供各测试共用
+_GH_RELEASE = MappingProxyType({
+    'tag_name': 'v1.1.0',
+    'assets': (MappingProxyType({'browser_download_url': 'http://example.com/fake_update.exe'}),),
+})
+
+
+class SharedTempDirTestCase(unittest.TestCase):
+    """整个测试类共用一个临时目录，每个测试使用唯一的文件名"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls._root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def unique_path(self, prefix, suffix=''):
+        """返回共享临时目录下的唯一路径"""
+        return self._root / f"{prefix}_{uuid.uuid4().hex}{suffix}"
+
+
+class TestEndToEndUpdate(SharedTempDirTestCase):
     """端到端更新流程测试"""
 
     def setUp(self):
         """设置测试环境"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        # 需要多个文件和子目录，使用共享临时目录下的独立子目录
+        self.temp_dir = self.unique_path('case')
+        self.temp_dir.mkdir(parents=True)
         self.config_file = self.temp_dir / 'config.json'
         self.backup_dir = self.temp_dir / 'backups'
         self.temp_download_dir = self.temp_dir / 'temp_downloads'
@@ -46,10 +85,6 @@ class TestEndToEndUpdate(unittest.TestCase):
         self.backup_dir.mkdir(exist_ok=True)
         self.temp_download_dir.mkdir(exist_ok=True)
 
-    def tearDown(self):
-        """清理测试环境"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_full_update_cycle(self):
         """测试完整更新周期"""
         updater = ZedUpdater(self.config)
@@ -67,10 +102,7 @@ class TestEndToEndUpdate(unittest.TestCase):
 
             # 模拟GitHub API响应
             mock_response = MagicMock()
-            mock_response.json.return_value = {
-                'tag_name': 'v1.1.0',
-                'assets': [{'browser_download_url': 'http://example.com/fake_update.exe'}]
-            }
+            mock_response.json.return_value = _GH_RELEASE
             mock_response.raise_for_status.return_value = None
             mock_session.get.return_value = mock_response
 
@@ -116,11 +148,17 @@ class TestEndToEndUpdate(unittest.TestCase):
         # 测试调度器基本功能
         self.assertFalse(scheduler.is_scheduler_running())
 
-        # 测试手动触发检查
+        # 测试手动触发检查：检查线程调用版本查询时发出信号，而不是固定等待
+        completion_event = threading.Event()
+
+        def latest_version_info(*args, **kwargs):
+            completion_event.set()
+            return {'version': '1.1.0'}
+
         with patch.object(updater, 'get_current_version', return_value='1.0.0'):
-            with patch.object(updater, 'get_latest_version_info', return_value={'version': '1.1.0'}):
+            with patch.object(updater, 'get_latest_version_info', side_effect=latest_version_info):
                 scheduler.force_check_now()
-                time.sleep(0.1)  # 给线程一点时间
+                self.assertTrue(completion_event.wait(timeout=2.0), "手动检查应该查询最新版本")
 
     def test_config_persistence(self):
         """测试配置持久化"""
@@ -138,25 +176,19 @@ class TestEndToEndUpdate(unittest.TestCase):
         # 重新创建配置对象来模拟重新加载
         new_config = Config(str(self.config_file))
 
-        # 验证配置被正确保存和加载
-        for key, value in test_values.items():
-            self.assertEqual(new_config.get_setting(key), value,
-                           f"配置项 {key} 应该被正确保存和加载")
+        # 验证配置被正确保存和加载，一次字典比较
+        loaded = {key: new_config.get_setting(key) for key in test_values}
+        self.assertEqual(loaded, test_values, "配置项应该被正确保存和加载")
 
 
-class TestErrorRecovery(unittest.TestCase):
+class TestErrorRecovery(SharedTempDirTestCase):
     """错误恢复测试"""
 
     def setUp(self):
         """设置测试环境"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.config_file = self.temp_dir / 'config.json'
+        self.config_file = self.unique_path('cfg', '.json')
         self.config = Config(str(self.config_file))
 
-    def tearDown(self):
-        """清理测试环境"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_network_failure_recovery(self):
         """测试网络失败恢复"""
         updater = ZedUpdater(self.config)
@@ -174,32 +206,32 @@ class TestErrorRecovery(unittest.TestCase):
         # 应该能够恢复到默认配置
         recovered_config = Config(str(self.config_file))
 
-        # 验证所有默认配置项都存在
-        for key in Config.DEFAULT_CONFIG.keys():
-            value = recovered_config.get_setting(key)
-            expected = Config.DEFAULT_CONFIG[key]
-            self.assertEqual(value, expected, f"配置项 {key} 应该恢复为默认值")
+        # 验证所有默认配置项都存在，一次字典比较
+        recovered = {key: recovered_config.get_setting(key) for key in Config.DEFAULT_CONFIG}
+        self.assertEqual(recovered, dict(Config.DEFAULT_CONFIG), "所有配置项应该恢复为默认值")
 
     def test_concurrent_config_modification(self):
         """测试并发配置文件修改"""
-        import threading
-
         errors = []
         successful_operations = []
+        worker_count = 3
+        iterations = 10
+        # 所有线程在屏障处同时开始，保留竞争窗口而无需sleep
+        start_barrier = threading.Barrier(worker_count)
 
         def modify_config(worker_id):
             """工作线程修改配置"""
             try:
-                for i in range(50):  # 减少循环次数以便测试
+                start_barrier.wait()
+                for i in range(iterations):
                     self.config.set_setting(f'worker_{worker_id}_item_{i}', f'value_{i}')
                     successful_operations.append(1)
-                    time.sleep(0.001)
             except Exception as e:
                 errors.append(f"Worker {worker_id}: {e}")
 
         # 启动多个线程同时修改配置
         threads = []
-        for i in range(3):  # 减少线程数量
+        for i in range(worker_count):
             t = threading.Thread(target=modify_config, args=(i,))
             threads.append(t)
             t.start()
@@ -210,20 +242,15 @@ class TestErrorRecovery(unittest.TestCase):
 
         # 验证没有错误发生
         self.assertEqual(len(errors), 0, f"并发测试中发生错误: {errors}")
-        self.assertGreater(len(successful_operations), 100, "应该有大量的成功操作")
+        self.assertEqual(len(successful_operations), worker_count * iterations, "所有操作都应该成功")
 
 
-class TestUnicodeCompatibility(unittest.TestCase):
+class TestUnicodeCompatibility(SharedTempDirTestCase):
     """Unicode兼容性测试"""
 
     def setUp(self):
         """设置测试环境"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.config_file = self.temp_dir / 'config.json'
-
-    def tearDown(self):
-        """清理测试环境"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.config_file = self.unique_path('cfg', '.json')
 
     def test_chinese_characters_in_config(self):
         """测试配置文件中的中文字符"""
@@ -243,9 +270,8 @@ class TestUnicodeCompatibility(unittest.TestCase):
         new_config = Config(str(self.config_file))
 
         # 验证中文字符被正确保存和加载
-        for key, value in chinese_settings.items():
-            loaded_value = new_config.get_setting(key)
-            self.assertEqual(loaded_value, value, f"中文配置项 {key} 应该被正确处理")
+        loaded = {key: new_config.get_setting(key) for key in chinese_settings}
+        self.assertEqual(loaded, chinese_settings, "中文配置项应该被正确处理")
 
     def test_emoji_in_config(self):
         """测试配置文件中的Emoji"""
@@ -262,9 +288,8 @@ class TestUnicodeCompatibility(unittest.TestCase):
 
         # 重新加载并验证
         new_config = Config(str(self.config_file))
-        for key, value in emoji_settings.items():
-            loaded_value = new_config.get_setting(key)
-            self.assertEqual(loaded_value, value, f"Emoji配置项 {key} 应该被正确处理")
+        loaded = {key: new_config.get_setting(key) for key in emoji_settings}
+        self.assertEqual(loaded, emoji_settings, "Emoji配置项应该被正确处理")
 
     def test_mixed_encoding_log_files(self):
         """测试混合编码的日志文件处理"""
@@ -279,55 +304,52 @@ class TestPerformanceMonitoring(unittest.TestCase):
         """测试配置操作性能"""
         config = Config()
 
+        # 覆盖率跟踪会让每次操作慢3-5倍，此时减少次数并放宽单次预算，避免不稳定
+        if _under_coverage():
+            iterations, budget_per_op = 20, 0.01
+        else:
+            iterations, budget_per_op = 100, 0.002
+
         # 批量设置大量配置项
         start_time = time.time()
-        for i in range(1000):
+        for i in range(iterations):
             config.set_setting(f'perf_test_key_{i}', f'test_value_{i}')
         end_time = time.time()
 
         duration = end_time - start_time
-        # 配置操作应该在合理时间内完成 (通常 < 1秒)
-        self.assertLess(duration, 2.0, f"配置操作耗时过长: {duration:.2f}秒")
+        self.assertLess(duration, iterations * budget_per_op, f"配置操作耗时过长: {duration:.2f}秒")
 
     def test_memory_usage_during_large_operations(self):
         """测试大型操作期间的内存使用"""
         # 这个测试需要外部监控工具，这里先用简单的验证
-        import gc
+        import tracemalloc
 
         config = Config()
-        initial_objects = len(gc.get_objects())
+        item_count = 500
+        item_size = 1000
 
-        # 执行大量操作
-        for i in range(500):
-            config.set_setting(f'mem_test_{i}', 'x' * 1000)  # 大字符串
+        # tracemalloc的计数器是O(1)读取，无需遍历整个堆
+        tracemalloc.start()
+        try:
+            initial_bytes = tracemalloc.get_traced_memory()[0]
 
-        gc.collect()
-        final_objects = len(gc.get_objects())
+            # 执行大量操作
+            for i in range(item_count):
+                config.set_setting(f'mem_test_{i}', 'x' * item_size)  # 大字符串
 
-        # 确保没有严重的内存泄漏
-        growth_ratio = final_objects / max(initial_objects, 1)
-        self.assertLess(growth_ratio, 3.0, f"对象数量增长过大: {growth_ratio:.2f}x")
+            final_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        # 保存的数据本身约 item_count * item_size 字节，增长不应超过其两倍
+        growth = final_bytes - initial_bytes
+        self.assertLess(growth, 2 * item_count * item_size, f"内存增长过大: {growth} 字节")
 
 
 if __name__ == '__main__':
-    # 创建测试套件
-    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
-
-    # 配置运行器
-    runner = unittest.TextTestRunner(
-        verbosity=2,
-        buffer=True,
-        failfast=True
-    )
-
-    # 运行测试
-    result = runner.run(suite)
-
-    # 输出结果摘要
-    print("\n" + "="*60)
-    print("测试结果摘要:")
-    print(f"运行测试: {result.testsRun}")
-    print(f"成功: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"失败: {len(result.failures)}")
-    print(f"错误: {len(result.errors)}")
-    print("="*60)
\ No newline at end of file
+    if '--parallel' in sys.argv:
+        # 各测试类互相独立，可交给pytest-xdist并行运行
+        import pytest
+        sys.exit(pytest.main([__file__, '-n', 'auto']))
+
+    unittest.main(verbosity=2, buffer=True)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ConfigManager 构造与保存测试
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from zed_updater.core.config import ConfigManager
+
+
+class TestConfigManagerConstruction(unittest.TestCase):
+    """两种构造方式得到的对象状态一致"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config_file = str(Path(temp_dir.name) / 'config.json')
+
+    def test_from_mapping_has_same_attributes_as_init(self):
+        """from_mapping 不读写磁盘，但实例属性与 __init__ 构造的完全相同"""
+        loaded = ConfigManager(self.config_file)
+        built = ConfigManager.from_mapping({'retry_count': 7}, self.config_file)
+
+        self.assertEqual(set(vars(built)), set(vars(loaded)))
+        self.assertEqual(built.get('retry_count'), 7)
+        self.assertEqual(built.config_file, loaded.config_file)
+
+
+class TestConfigManagerDeferredSave(unittest.TestCase):
+    """set() 延迟保存，flush() 报告保存结果"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config_file = Path(temp_dir.name) / 'config.json'
+        self.config = ConfigManager(str(self.config_file))
+        self.addCleanup(self.config.flush)
+
+    def test_flush_persists_pending_set(self):
+        """flush() 立即写入尚在延迟中的修改"""
+        self.assertTrue(self.config.set('retry_count', 6))
+        self.assertTrue(self.config.flush())
+
+        self.assertEqual(ConfigManager(str(self.config_file)).get('retry_count'), 6)
+
+    def test_flush_reports_failed_save_and_retries(self):
+        """保存失败时 flush() 返回False，修改保持待保存，下次 flush() 重试"""
+        # 用同名目录占住配置文件路径，使替换失败
+        self.config_file.unlink()
+        self.config_file.mkdir()
+
+        self.assertTrue(self.config.set('retry_count', 8))
+        self.assertFalse(self.config.flush())
+        self.assertFalse(self.config.flush())
+
+        self.config_file.rmdir()
+        self.assertTrue(self.config.flush())
+        self.assertEqual(ConfigManager(str(self.config_file)).get('retry_count'), 8)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -34,47 +34,49 @@ def test_config_thread_safety():
             # 创建配置实例
             config = Config(str(config_file))
 
-            # 结果收集
-            results = []
-            errors = []
+            iterations = 50  # 减少数量确保测试完整性
+            ops_per_iteration = 3
 
             def config_worker(worker_id):
-                """配置操作工作线程"""
+                """配置操作工作线程，返回 (成功操作数, 错误列表)"""
+                # 预分配线程本地结果，避免在计时窗口内扩容列表和竞争共享列表
+                thread_results = [None] * (iterations * ops_per_iteration)
+                idx = 0
+                worker_errors = []
                 try:
-                    thread_results = []
-
                     # 执行多种配置操作
-                    for i in range(50):  # 减少数量确保测试完整性
+                    for i in range(iterations):
                         # 读操作
                         try:
                             current_value = config.get_setting('test_key', 'default')
-                            thread_results.append(f"read_{worker_id}_{i}")
+                            thread_results[idx] = f"read_{worker_id}_{i}"
+                            idx += 1
                         except Exception as e:
-                            errors.append(f"Read error in worker {worker_id}: {e}")
+                            worker_errors.append(f"Read error in worker {worker_id}: {e}")
 
                         # 写操作
                         try:
                             config.set_setting('test_key', f'value_{worker_id}_{i}')
-                            thread_results.append(f"write_{worker_id}_{i}")
+                            thread_results[idx] = f"write_{worker_id}_{i}"
+                            idx += 1
                         except Exception as e:
-                            errors.append(f"Write error in worker {worker_id}: {e}")
+                            worker_errors.append(f"Write error in worker {worker_id}: {e}")
 
                         # 批量更新
                         try:
                             batch_data = {f'batch_key_{worker_id}_{i}': f'batch_value_{worker_id}_{i}'}
                             config.update_settings(batch_data, save=False)  # 不保存以减少I/O
-                            thread_results.append(f"batch_{worker_id}_{i}")
+                            thread_results[idx] = f"batch_{worker_id}_{i}"
+                            idx += 1
                         except Exception as e:
-                            errors.append(f"Batch error in worker {worker_id}: {e}")
+                            worker_errors.append(f"Batch error in worker {worker_id}: {e}")
 
                         time.sleep(0.001)  # 短暂延迟增加并发概率
 
-                    results.extend(thread_results)
-                    return len(thread_results)
-
                 except Exception as e:
-                    errors.append(f"Unexpected error in worker {worker_id}: {e}")
-                    return 0
+                    worker_errors.append(f"Unexpected error in worker {worker_id}: {e}")
+
+                return idx, worker_errors
 
             # 启动多个线程同时操作配置
             print("启动并发配置操作测试...")
@@ -82,14 +84,14 @@ def test_config_thread_safety():
 
             with ThreadPoolExecutor(max_workers=5) as executor:  # 减少线程数
                 futures = [executor.submit(config_worker, i) for i in range(5)]
-
-                thread_results = []
-                for future in as_completed(futures):
-                    result = future.result()
-                    thread_results.append(result)
+                worker_outcomes = [future.result() for future in as_completed(futures)]
 
             end_time = time.time()
 
+            # 计时结束后再汇总结果
+            thread_results = [count for count, _ in worker_outcomes]
+            errors = [error for _, worker_errors in worker_outcomes for error in worker_errors]
+
             total_operations = sum(thread_results)
             duration = end_time - start_time
             ops_per_second = total_operations / duration if duration > 0 else 0
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EncodingUtils 文件写入与解码测试
+"""
+
+import os
+import sys
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from zed_updater.utils.encoding import EncodingUtils
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """原子写入的权限保留与备份"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.target = Path(temp_dir.name) / 'config.json'
+
+    @unittest.skipIf(sys.platform == 'win32', "Windows 不支持POSIX权限位")
+    def test_replace_keeps_target_mode(self):
+        """替换已有文件后保留其权限，0600 不会变成 0644"""
+        self.target.write_bytes(b'{}')
+        os.chmod(self.target, 0o600)
+
+        old_umask = os.umask(0o022)
+        try:
+            EncodingUtils._atomic_write(self.target, (b'{"a": 1}',), backup=False)
+        finally:
+            os.umask(old_umask)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.target).st_mode), 0o600)
+        self.assertEqual(self.target.read_bytes(), b'{"a": 1}')
+
+    def test_backup_keeps_previous_content(self):
+        """每次写入后 .backup 保存上一版本的内容，不随新写入改变"""
+        EncodingUtils._atomic_write(self.target, (b'v1',))
+        EncodingUtils._atomic_write(self.target, (b'v2',))
+        backup = self.target.with_suffix('.json.backup')
+        self.assertEqual(backup.read_bytes(), b'v1')
+
+        EncodingUtils._atomic_write(self.target, (b'v3',))
+        self.assertEqual(backup.read_bytes(), b'v2')
+        self.assertEqual(self.target.read_bytes(), b'v3')
+
+    @unittest.skipIf(sys.platform == 'win32', "Windows 不支持POSIX权限位")
+    def test_backup_path_keeps_target_mode(self):
+        """带备份写入时目标与备份都保留原权限"""
+        self.target.write_bytes(b'v1')
+        os.chmod(self.target, 0o600)
+
+        EncodingUtils._atomic_write(self.target, (b'v2',))
+
+        backup = self.target.with_suffix('.json.backup')
+        self.assertEqual(stat.S_IMODE(os.stat(self.target).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(backup).st_mode), 0o600)
+
+
+class TestSafeDecode(unittest.TestCase):
+    """safe_decode 的自动检测解码"""
+
+    def test_leading_bom_is_kept(self):
+        """自动检测时保留开头的BOM（U+FEFF），解码结果可原样编码回去"""
+        data = b'\xef\xbb\xbf' + '中文配置'.encode('utf-8')
+
+        text = EncodingUtils.safe_decode(data)
+
+        self.assertEqual(text, '\ufeff中文配置')
+        self.assertEqual(text.encode('utf-8'), data)
+
+    def test_gbk_fallback(self):
+        """非UTF-8数据按GBK解码"""
+        self.assertEqual(EncodingUtils.safe_decode('中文配置'.encode('gbk')), '中文配置')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
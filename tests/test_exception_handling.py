@@ -11,6 +11,9 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, side_effect
 
+import requests
+import requests_mock
+
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -20,10 +23,20 @@ from updater.updater import ZedUpdater
 class TestExceptionHandling(unittest.TestCase):
     """测试异常处理改进"""
 
+    @classmethod
+    def setUpClass(cls):
+        """整个测试类共用一个更新器实例，只构造一次"""
+        cls.config_mock = MagicMock()
+        cls.updater = ZedUpdater(cls.config_mock)
+
     def setUp(self):
-        """测试前准备"""
-        self.config_mock = MagicMock()
-        self.updater = ZedUpdater(self.config_mock)
+        """测试前准备：记录会被测试修改的更新器状态"""
+        self.config_mock.reset_mock()
+        self._saved_download_url = getattr(self.updater, 'download_url', None)
+
+    def tearDown(self):
+        """恢复更新器状态，避免影响后续测试"""
+        self.updater.download_url = self._saved_download_url
 
     @patch('updater.updater.Path.exists')
     @patch('updater.updater.subprocess.run')
@@ -53,10 +66,10 @@ class TestExceptionHandling(unittest.TestCase):
             # 应该记录警告信息
             mock_logger.warning.assert_called()
 
-    @patch('updater.updater.requests.Session.get')
-    def test_get_latest_version_network_error(self, mock_get):
+    @requests_mock.Mocker()
+    def test_get_latest_version_network_error(self, m):
         """测试网络请求错误处理"""
-        mock_get.side_effect = ConnectionError("网络连接失败")
+        m.get(requests_mock.ANY, exc=requests.exceptions.ConnectionError("网络连接失败"))
 
         with patch('updater.updater.logger') as mock_logger:
             result = self.updater.get_latest_version_info()
@@ -7,14 +7,16 @@ Zed Updater 修复功能测试
 
 import unittest
 import tempfile
-import shutil
 import os
 import threading
-import time
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, mock_open
 import sys
 import json
+import uuid
+
+import requests
+import requests_mock
 
 # 添加项目路径
 project_root = Path(__file__).parent.parent
@@ -24,29 +26,48 @@ from updater.config import Config
 from updater.updater import ZedUpdater
 
 
-class TestConfigFixes(unittest.TestCase):
+class SharedTempDirTestCase(unittest.TestCase):
+    """整个测试类共用一个临时目录，每个测试使用唯一的文件名"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls._root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def unique_path(self, prefix, suffix=''):
+        """返回共享临时目录下的唯一路径"""
+        return self._root / f"{prefix}_{uuid.uuid4().hex}{suffix}"
+
+
+class TestConfigFixes(SharedTempDirTestCase):
     """测试配置模块的修复"""
 
     def setUp(self):
         """测试环境设置"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / 'test_config.json'
+        self.config_file = self.unique_path('cfg', '.json')
 
-    def tearDown(self):
-        """清理测试环境"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @staticmethod
+    def written_text(mocked_open):
+        """拼接mock_open句柄上所有write调用写入的内容"""
+        return ''.join(c.args[0] for c in mocked_open().write.call_args_list)
 
     def test_atomic_write_config(self):
         """测试原子配置文件写入"""
-        config = Config(str(self.config_file))
+        # 写入只进内存，替换操作被记录而不落盘
+        with patch('updater.config.open', mock_open()) as mocked_open, \
+                patch('updater.config.os.replace') as mock_replace:
+            config = Config(str(self.config_file))
 
-        # 测试正常写入
-        config.set_setting('test_key', 'test_value')
-        self.assertTrue(self.config_file.exists())
+            # 测试正常写入
+            config.set_setting('test_key', 'test_value')
+            self.assertTrue(mock_replace.called)
 
-        # 验证文件内容
-        with open(self.config_file, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+            # 验证文件内容
+            data = json.loads(self.written_text(mocked_open).lstrip('\ufeff'))
         self.assertEqual(data['test_key'], 'test_value')
 
     def test_config_thread_safety(self):
@@ -55,20 +76,23 @@ class TestConfigFixes(unittest.TestCase):
 
         results = []
         errors = []
+        worker_count = 5
+        # 所有线程同时开始写入，竞争窗口由屏障保证而不是靠sleep和大循环
+        start_barrier = threading.Barrier(worker_count)
 
         def worker(worker_id):
             """工作线程"""
             try:
-                for i in range(100):
+                start_barrier.wait()
+                for i in range(10):
                     config.set_setting(f'key_{worker_id}_{i}', f'value_{worker_id}_{i}')
-                    time.sleep(0.001)  # 小的延迟以增加竞争
                 results.append(f'worker_{worker_id}_done')
             except Exception as e:
                 errors.append(f'worker_{worker_id}_error: {e}')
 
         # 启动多个线程
         threads = []
-        for i in range(5):
+        for i in range(worker_count):
             t = threading.Thread(target=worker, args=(i,))
             threads.append(t)
             t.start()
@@ -83,75 +107,67 @@ class TestConfigFixes(unittest.TestCase):
 
     def test_unicode_handling(self):
         """测试Unicode字符处理"""
-        config = Config(str(self.config_file))
-
-        # 测试中文字符
         chinese_text = '中文测试字符串'
-        config.set_setting('chinese_key', chinese_text)
 
-        # 重新加载配置
-        config.reload()
+        with patch('updater.config.open', mock_open()) as mocked_open, \
+                patch('updater.config.os.replace'):
+            config = Config(str(self.config_file))
+
+            # 测试中文字符
+            config.set_setting('chinese_key', chinese_text)
+            written = self.written_text(mocked_open)
+
+        # 重新加载配置，读取的正是刚才写入的内容
+        with patch('updater.config.open', mock_open(read_data=written)):
+            config.reload()
         self.assertEqual(config.get_setting('chinese_key'), chinese_text)
 
     def test_config_validation(self):
         """测试配置验证"""
-        config = Config(str(self.config_file))
+        with patch('updater.config.open', mock_open()), \
+                patch('updater.config.os.replace'):
+            config = Config(str(self.config_file))
 
-        # 测试无效路径
-        config.set_setting('zed_install_path', '')
-        errors = config.validate_config()
-        self.assertIn('zed_install_path', errors)
+            # 测试无效路径
+            config.set_setting('zed_install_path', '')
+            errors = config.validate_config()
+            self.assertIn('zed_install_path', errors)
 
-        # 测试无效间隔
-        config.set_setting('check_interval_hours', -1)
-        errors = config.validate_config()
-        self.assertIn('check_interval_hours', errors)
+            # 测试无效间隔
+            config.set_setting('check_interval_hours', -1)
+            errors = config.validate_config()
+            self.assertIn('check_interval_hours', errors)
 
 
-class TestUpdaterFixes(unittest.TestCase):
+class TestUpdaterFixes(SharedTempDirTestCase):
     """测试更新器模块的修复"""
 
     def setUp(self):
         """测试环境设置"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / 'test_config.json'
+        self.config_file = self.unique_path('cfg', '.json')
         self.config = Config(str(self.config_file))
 
-    def tearDown(self):
-        """清理测试环境"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    @patch('updater.updater.requests.Session')
-    def test_download_with_retry(self, mock_session_class):
+    def test_download_with_retry(self):
         """测试带重试的下载功能"""
-        # 创建模拟的session和response
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
-        # 模拟前两次请求失败，最后一次成功
-        mock_response = MagicMock()
-        mock_response.headers.get.return_value = '1024'  # 1KB文件
-        mock_response.iter_content.return_value = [b'x' * 1024]  # 模拟文件内容
-        mock_response.raise_for_status.return_value = None
-
-        # 前两次抛出异常，最后一次成功
-        mock_session.get.side_effect = [
-            Exception("Network error"),
-            Exception("Timeout"),
-            mock_response
-        ]
+        with requests_mock.Mocker() as m:
+            # 前两次抛出异常，最后一次成功返回1KB文件
+            m.get('http://example.com/test.exe', [
+                {'exc': requests.exceptions.ConnectionError},
+                {'exc': requests.exceptions.Timeout},
+                {'content': b'x' * 1024, 'headers': {'Content-Length': '1024'}},
+            ])
 
-        updater = ZedUpdater(self.config)
-        updater.download_url = 'http://example.com/test.exe'
+            updater = ZedUpdater(self.config)
+            updater.download_url = 'http://example.com/test.exe'
 
-        result = updater.download_update()
+            result = updater.download_update()
 
-        # 验证结果
-        self.assertIsNotNone(result)
-        self.assertTrue(result.exists())
+            # 验证结果
+            self.assertIsNotNone(result)
+            self.assertTrue(result.exists())
 
-        # 验证重试次数
-        self.assertEqual(mock_session.get.call_count, 3)
+            # 验证重试次数
+            self.assertEqual(m.call_count, 3)
 
     def test_safe_filename_extraction(self):
         """测试安全文件名提取"""
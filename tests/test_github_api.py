@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GitHubAPI 响应解析与认证测试
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests_mock
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from zed_updater.services.github_api import GitHubAPI
+
+
+LATEST_URL = 'https://api.github.com/repos/TC999/zed-loc/releases/latest'
+
+
+class TestGitHubAPIMalformedBody(unittest.TestCase):
+    """200 响应体不是合法JSON时的处理"""
+
+    def setUp(self):
+        # 不读取本机的令牌，也不真正等待退避
+        env = patch.dict('os.environ', {'GH_CONFIG_DIR': str(project_root / 'nonexistent')})
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ('GITHUB_TOKEN', 'GH_TOKEN'):
+            env.in_dict.pop(name, None)
+
+        sleep = patch('zed_updater.services.github_api.time.sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+        self.api = GitHubAPI()
+
+    @requests_mock.Mocker()
+    def test_malformed_body_is_retried_then_gives_up(self, m):
+        """HTML错误页或截断的响应应按失败重试，最终返回None而不是抛出异常"""
+        m.get(LATEST_URL, [
+            {'status_code': 200, 'text': '<html>Bad gateway</html>'},
+            {'status_code': 200, 'text': '{"tag_name": "v1.0", "assets": ['},
+            {'status_code': 200, 'text': ''},
+        ])
+
+        self.assertIsNone(self.api.get_latest_release())
+        self.assertEqual(m.call_count, GitHubAPI.MAX_RETRIES)
+
+    @requests_mock.Mocker()
+    def test_malformed_body_recovers_on_retry(self, m):
+        """第一次响应损坏、第二次正常时应返回解析结果"""
+        m.get(LATEST_URL, [
+            {'status_code': 200, 'text': '<html>Bad gateway</html>'},
+            {'status_code': 200, 'json': {'tag_name': 'v1.0'}},
+        ])
+
+        self.assertEqual(self.api._make_request('/repos/TC999/zed-loc/releases/latest'),
+                         {'tag_name': 'v1.0'})
+        self.assertEqual(m.call_count, 2)
+
+
+class TestGitHubAPIToken(unittest.TestCase):
+    """环境与gh CLI中的令牌只发送给签发它的主机"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        (Path(temp_dir.name) / 'hosts.yml').write_text(
+            'github.com:\n'
+            '    oauth_token: gho_public\n'
+            'ghe.example.com:\n'
+            '    oauth_token: gho_enterprise\n',
+            encoding='utf-8'
+        )
+        env = patch.dict('os.environ', {'GH_CONFIG_DIR': temp_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ('GITHUB_TOKEN', 'GH_TOKEN'):
+            env.in_dict.pop(name, None)
+
+    def test_github_com_uses_ambient_token(self):
+        """api.github.com 使用环境变量或github.com条目的令牌"""
+        self.assertEqual(GitHubAPI().session.headers.get('Authorization'), 'Bearer gho_public')
+
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'env_token'}):
+            self.assertEqual(GitHubAPI().session.headers.get('Authorization'), 'Bearer env_token')
+
+    def test_mirror_does_not_receive_github_token(self):
+        """自定义或镜像API地址不应收到github.com的令牌"""
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'env_token'}):
+            api = GitHubAPI(api_url='https://mirror.example.org/api')
+
+        self.assertNotIn('Authorization', api.session.headers)
+
+    def test_enterprise_host_uses_matching_entry(self):
+        """企业版主机只使用hosts.yml中对应主机的令牌"""
+        api = GitHubAPI(api_url='https://ghe.example.com/api/v3')
+
+        self.assertEqual(api.session.headers.get('Authorization'), 'Bearer gho_enterprise')
+
+    def test_explicit_token_is_always_used(self):
+        """显式传入的令牌对任何地址都生效"""
+        api = GitHubAPI(api_url='https://mirror.example.org/api', token='explicit')
+
+        self.assertEqual(api.session.headers.get('Authorization'), 'Bearer explicit')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
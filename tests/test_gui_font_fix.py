@@ -18,6 +18,139 @@ os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 print("测试GUI字体修复...")
 
+# 各检查方法对应的修复代码，模块导入时构建一次
+_FIX_FAMILIES = '''
+# PyQt5字体检查修复
+_FONT_CACHE = None
+
+def check_font_availability(font_name):
+    \"\"\"检查字体是否可用（字体列表只查询一次）\"\"\"
+    global _FONT_CACHE
+    try:
+        if _FONT_CACHE is None:
+            families = frozenset(QFontDatabase().families())
+            # QApplication创建之前结果为空，不缓存，之后再查询
+            if not families:
+                return True
+            _FONT_CACHE = families
+        return font_name in _FONT_CACHE
+    except AttributeError:
+        # PyQt5中可能使用不同的方法
+        return True  # 退回到默认行为
+'''
+
+_FIX_HASFAMILY = '''
+# PyQt5字体检查修复（如果hasFamily存在）
+def check_font_availability(font_name):
+    \"\"\"检查字体是否可用\"\"\"
+    try:
+        return QFontDatabase().hasFamily(font_name)
+    except AttributeError:
+        return True  # 退回到默认行为
+'''
+
+_FIX_GENERIC = '''
+# 通用字体检查修复
+def check_font_availability(font_name):
+    \"\"\"检查字体是否可用\"\"\"
+    try:
+        # 尝试多种方法
+        if hasattr(QFontDatabase(), 'families'):
+            available_fonts = QFontDatabase().families()
+            return font_name in available_fonts
+        elif hasattr(QFontDatabase(), 'hasFamily'):
+            return QFontDatabase().hasFamily(font_name)
+        else:
+            return True  # 退回到默认行为
+    except Exception:
+        return True  # 退回到默认行为
+'''
+
+# 推荐的安全字体设置代码
+_FIX_SAFE = '''
+import functools
+from typing import FrozenSet, Optional
+
+# 已安装字体集合，首次成功查询后缓存
+_FONT_CACHE: Optional[FrozenSet[str]] = None
+
+def _font_set():
+    \"\"\"返回已安装字体集合；QApplication创建之前查询结果为空，不缓存\"\"\"
+    global _FONT_CACHE
+    if _FONT_CACHE is None:
+        from PyQt5.QtGui import QFontDatabase
+        from PyQt5.QtWidgets import QApplication
+
+        if QApplication.instance() is None:
+            return frozenset()
+
+        # families()在Qt6中是静态方法（且禁止构造QFontDatabase）；
+        # PyQt5中需要实例，此时只构造一次
+        try:
+            families = QFontDatabase.families()
+        except TypeError:
+            families = QFontDatabase().families()
+        if not families:
+            return frozenset()
+        _FONT_CACHE = frozenset(families)
+    return _FONT_CACHE
+
+def safe_check_font_availability(font_name):
+    \"\"\"安全检查字体可用性，支持PyQt5兼容性\"\"\"
+    # QApplication创建之前无法查询字体，按可用处理且不缓存结果
+    if not _font_set():
+        return True
+    return _check_font_cached(font_name)
+
+@functools.lru_cache(maxsize=512)
+def _check_font_cached(font_name):
+    \"\"\"按字体名缓存的检查结果，缺失字体也不再重复查询\"\"\"
+    try:
+        from PyQt5.QtGui import QFontDatabase
+
+        return font_name in _font_set()
+
+    except AttributeError:
+        # 如果方法不存在，使用退回策略
+        result = True  # 最后的退回策略：假设字体可用，交给系统处理
+        try:
+            # 尝试其他方法
+            if hasattr(QFontDatabase, 'hasFamily'):
+                result = bool(QFontDatabase.hasFamily(font_name))
+        except:
+            pass
+
+        return result
+
+    except Exception as e:
+        print(f"字体检查失败: {e}")
+        return True  # 退回到默认行为，不中断应用程序启动
+
+# 在GUI代码中使用安全检查
+def setup_fonts_safe():
+    \"\"\"安全的字体设置\"\"\"
+    try:
+        from PyQt5.QtGui import QFont, QFontDatabase
+
+        # 中文字体候选列表
+        chinese_fonts = ['Microsoft YaHei', 'SimHei', 'SimSun', 'Arial Unicode MS']
+
+        # 查找可用的中文字体（一次集合查询，无需逐个调用Qt），找不到时退回Arial
+        available_fonts = _font_set()
+        selected_font = next((f for f in chinese_fonts if f in available_fonts), "Arial")
+
+        # 设置字体
+        font = QFont(selected_font)
+
+        # 应用字体设置
+        font.setPointSize(9)
+        return font
+
+    except Exception as e:
+        print(f"字体设置失败，使用系统默认: {e}")
+        return QFont()  # 使用默认字体
+'''
+
 def test_font_availability():
     """测试字体可用性检查方法"""
     try:
@@ -51,10 +184,8 @@ def test_font_availability():
                 elif method_name == 'families':
                     # 模拟families()方法
                     mock_font_db.families.return_value = ['Arial', 'Microsoft YaHei', 'SimSun', 'Times New Roman']
-                    available_fonts = mock_font_db.families()
-                    for font in chinese_fonts:
-                        if font in available_fonts:
-                            found_fonts.append(font)
+                    available_fonts = frozenset(mock_font_db.families())
+                    found_fonts = [font for font in chinese_fonts if font in available_fonts]
                     working_method = method_name
                     print(f"  ✅ families()方法工作正常，发现字体: {found_fonts}")
                     break
@@ -62,10 +193,8 @@ def test_font_availability():
                 elif method_name == 'fontFamilies':
                     # 模拟fontFamilies方法
                     mock_font_db.fontFamilies.return_value = ['Arial', 'Microsoft YaHei']
-                    available_fonts = mock_font_db.fontFamilies()
-                    for font in chinese_fonts:
-                        if font in available_fonts:
-                            found_fonts.append(font)
+                    available_fonts = frozenset(mock_font_db.fontFamilies())
+                    found_fonts = [font for font in chinese_fonts if font in available_fonts]
                     working_method = method_name
                     print(f"  ✅ fontFamilies()方法工作正常，发现字体: {found_fonts}")
                     break
@@ -73,10 +202,8 @@ def test_font_availability():
                 elif method_name == 'availableFamilies':
                     # 模拟availableFamilies方法
                     mock_font_db.availableFamilies.return_value = ['Arial', 'SimHei', 'Microsoft YaHei']
-                    available_fonts = mock_font_db.availableFamilies()
-                    for font in chinese_fonts:
-                        if font in available_fonts:
-                            found_fonts.append(font)
+                    available_fonts = frozenset(mock_font_db.availableFamilies())
+                    found_fonts = [font for font in chinese_fonts if font in available_fonts]
                     working_method = method_name
                     print(f"  ✅ availableFamilies()方法工作正常，发现字体: {found_fonts}")
                     break
@@ -92,44 +219,11 @@ def test_font_availability():
             print("  中文字体: {', '.join(found_fonts) if found_fonts else '无'}")
 
             if working_method == 'families':
-                fix_code = '''
-# PyQt5字体检查修复
-def check_font_availability(font_name):
-    \"\"\"检查字体是否可用\"\"\"
-    try:
-        available_fonts = QFontDatabase().families()
-        return font_name in available_fonts
-    except AttributeError:
-        # PyQt5中可能使用不同的方法
-        return True  # 退回到默认行为
-'''
+                fix_code = _FIX_FAMILIES
             elif working_method == 'hasFamily':
-                fix_code = '''
-# PyQt5字体检查修复（如果hasFamily存在）
-def check_font_availability(font_name):
-    \"\"\"检查字体是否可用\"\"\"
-    try:
-        return QFontDatabase().hasFamily(font_name)
-    except AttributeError:
-        return True  # 退回到默认行为
-'''
+                fix_code = _FIX_HASFAMILY
             else:
-                fix_code = '''
-# 通用字体检查修复
-def check_font_availability(font_name):
-    \"\"\"检查字体是否可用\"\"\"
-    try:
-        # 尝试多种方法
-        if hasattr(QFontDatabase(), 'families'):
-            available_fonts = QFontDatabase().families()
-            return font_name in available_fonts
-        elif hasattr(QFontDatabase(), 'hasFamily'):
-            return QFontDatabase().hasFamily(font_name)
-        else:
-            return True  # 退回到默认行为
-    except Exception:
-        return True  # 退回到默认行为
-'''
+                fix_code = _FIX_GENERIC
 
             print("
 代码修复:"            print(fix_code)
@@ -148,64 +242,7 @@ def check_font_availability(font_name):
 
 def generate_font_fix():
     """生成字体修复代码"""
-    fix_code = '''
-def safe_check_font_availability(font_name):
-    \"\"\"安全检查字体可用性，支持PyQt5兼容性\"\"\"
-    try:
-        from PyQt5.QtGui import QFontDatabase
-
-        # PyQt5中正确的方法是families()
-        available_fonts = QFontDatabase.families()
-        return font_name in available_fonts
-
-    except AttributeError:
-        # 如果方法不存在，使用退回策略
-        try:
-            # 尝试其他方法
-            if hasattr(QFontDatabase, 'hasFamily'):
-                return QFontDatabase.hasFamily(font_name)
-        except:
-            pass
-
-        # 最后的退回策略
-        return True  # 假设字体可用，交给系统处理
-
-    except Exception as e:
-        print(f"字体检查失败: {e}")
-        return True  # 退回到默认行为，不中断应用程序启动
-
-# 在GUI代码中使用安全检查
-def setup_fonts_safe():
-    \"\"\"安全的字体设置\"\"\"
-    try:
-        from PyQt5.QtGui import QFont, QFontDatabase
-
-        # 中文字体候选列表
-        chinese_fonts = ['Microsoft YaHei', 'SimHei', 'SimSun', 'Arial Unicode MS']
-
-        # 查找可用的中文字体
-        selected_font = None
-        for font_name in chinese_fonts:
-            if safe_check_font_availability(font_name):
-                selected_font = font_name
-                break
-
-        # 设置字体
-        if selected_font:
-            font = QFont(selected_font)
-        else:
-            font = QFont("Arial")  # 退回默认字体
-
-        # 应用字体设置
-        font.setPointSize(9)
-        return font
-
-    except Exception as e:
-        print(f"字体设置失败，使用系统默认: {e}")
-        return QFont()  # 使用默认字体
-'''
-
-    return fix_code
+    return _FIX_SAFE
 
 if __name__ == '__main__':
     print("Zed Updater GUI字体修复测试")
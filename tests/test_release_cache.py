@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+最新发布信息缓存（ETag重新验证）测试
+"""
+
+import sys
+import json
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import requests_mock
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from zed_updater.core.config import ConfigManager
+from zed_updater.core.updater import ZedUpdater
+
+
+REPO = 'TC999/zed-loc'
+LATEST_URL = f'https://api.github.com/repos/{REPO}/releases/latest'
+
+
+def _release(tag):
+    """构造最小的发布JSON"""
+    return {
+        'tag_name': tag,
+        'published_at': '2024-01-15T00:00:00Z',
+        'body': '',
+        'assets': [{
+            'name': 'zed-windows.exe',
+            'browser_download_url': f'https://example.com/{tag}/zed.exe',
+            'size': 1024,
+        }],
+    }
+
+
+class TestReleaseCache(unittest.TestCase):
+    """发布信息缓存的重新验证与过期"""
+
+    def setUp(self):
+        """每个测试使用独立的临时配置与缓存目录，不触及用户主目录"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name) / 'cache'
+        self.config = ConfigManager(str(Path(temp_dir.name) / 'config.json'))
+        self.addCleanup(self.config.flush)
+        self.updater = ZedUpdater(self.config, cache_dir=self.cache_dir)
+
+    def _seed_cache(self, tag, age):
+        """写入一个age秒前缓存的条目"""
+        self.updater._write_release_cache({
+            'schema_version': ZedUpdater.RELEASE_CACHE_SCHEMA,
+            'repo': REPO,
+            'etag': '"v1-etag"',
+            'cached_at': time.time() - age,
+            'payload': _release(tag),
+        })
+
+    def _cached_at(self):
+        """读取缓存文件中的缓存时间"""
+        with open(self.cache_dir / 'latest_release.json', encoding='utf-8') as f:
+            return json.load(f)['cached_at']
+
+    @requests_mock.Mocker()
+    def test_explicit_check_revalidates_fresh_cache(self, m):
+        """手动检查即使缓存未过期也要发送If-None-Match，304时使用缓存内容"""
+        self._seed_cache('v1.0.0', age=10)
+        seeded_at = self._cached_at()
+        m.get(LATEST_URL, status_code=304)
+
+        info = self.updater.get_latest_version_info()
+
+        self.assertEqual(info.version, '1.0.0')
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(m.last_request.headers.get('If-None-Match'), '"v1-etag"')
+        self.assertGreater(self._cached_at(), seeded_at)
+
+    @requests_mock.Mocker()
+    def test_scheduled_poll_uses_fresh_cache(self, m):
+        """定时检查在TTL内直接使用缓存，不发请求"""
+        self._seed_cache('v1.0.0', age=10)
+
+        info = self.updater.get_latest_version_info(allow_cached=True)
+
+        self.assertEqual(info.version, '1.0.0')
+        self.assertEqual(m.call_count, 0)
+
+    @requests_mock.Mocker()
+    def test_expired_cache_is_replaced(self, m):
+        """缓存过期后定时检查也要重新验证，200时替换缓存内容"""
+        self._seed_cache('v1.0.0', age=ZedUpdater.RELEASE_CACHE_TTL + 60)
+        m.get(LATEST_URL, json=_release('v2.0.0'), headers={'ETag': '"v2-etag"'})
+
+        info = self.updater.get_latest_version_info(allow_cached=True)
+
+        self.assertEqual(info.version, '2.0.0')
+        self.assertEqual(m.last_request.headers.get('If-None-Match'), '"v1-etag"')
+        cached = self.updater._read_release_cache(REPO)
+        self.assertEqual(cached['etag'], '"v2-etag"')
+        self.assertEqual(cached['payload']['tag_name'], 'v2.0.0')
+
+    @requests_mock.Mocker()
+    def test_non_path_cache_dir_means_no_cache(self, m):
+        """配置返回的缓存目录不是路径时（如MagicMock配置）按无缓存处理"""
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: default
+        updater = ZedUpdater(config)
+        m.get(LATEST_URL, json=_release('v3.0.0'))
+
+        info = updater.get_latest_version_info()
+
+        self.assertIsNotNone(info)
+        self.assertEqual(info.version, '3.0.0')
+        self.assertNotIn('If-None-Match', m.last_request.headers)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
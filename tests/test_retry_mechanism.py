@@ -6,7 +6,11 @@
 
 import sys
 import os
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from contextlib import contextmanager
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -20,6 +24,8 @@ os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 print("开始测试网络重试机制...")
 
+import requests
+
 try:
     from updater.updater import ZedUpdater
     from updater.config import Config
@@ -29,37 +35,108 @@ except ImportError as e:
     print(f"❌ 导入失败: {e}")
     sys.exit(1)
 
+# 所有测试共用的成功响应；spec限定为真实Response的属性
+_OK = Mock(spec=requests.Response)
+_OK.raise_for_status.return_value = None
+_OK.headers = Mock()
+_OK.headers.get.return_value = '1024'
+_OK.iter_content.return_value = [b'x' * 1024]
+
+class _StubConfig:
+    """内存配置桩，只实现更新器用到的读写接口，避免每次构造都读写JSON文件"""
+
+    def __init__(self, d=None):
+        self._d = d or {}
+
+    def get_setting(self, k, default=None):
+        return self._d.get(k, default)
+
+    def set_setting(self, k, v):
+        self._d[k] = v
+
+@contextmanager
+def fast_patch_get(responses):
+    """用普通函数替换requests.Session.get，按顺序返回响应或抛出异常
+
+    比Mock的调用分发轻量；调用次数记录在返回函数的call_count属性上。
+    """
+    original_get = requests.Session.get
+    responses = iter(responses)
+
+    def fake_get(self, *args, **kwargs):
+        fake_get.call_count += 1
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    fake_get.call_count = 0
+    requests.Session.get = fake_get
+    try:
+        yield fake_get
+    finally:
+        requests.Session.get = original_get
+
+@contextmanager
+def patch_get_by_url(scripts, barrier=None):
+    """线程安全地替换requests.Session.get，每个URL按各自的顺序返回响应或抛出异常
+
+    所有线程共用同一个替换函数，避免并发的替换/恢复互相覆盖。传入barrier时，
+    每个URL的第一次请求在barrier处等待，确保各worker的下载确实同时进行。
+    """
+    original_get = requests.Session.get
+    scripts = {url: iter(responses) for url, responses in scripts.items()}
+    seen = set()
+    lock = threading.Lock()
+
+    def fake_get(self, url, *args, **kwargs):
+        with lock:
+            first = url not in seen
+            seen.add(url)
+            response = next(scripts[url])
+        if first and barrier is not None:
+            barrier.wait()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    requests.Session.get = fake_get
+    try:
+        yield fake_get
+    finally:
+        requests.Session.get = original_get
+
 def test_retry_mechanism():
     """测试网络重试机制"""
     print("\n=== 网络重试机制功能测试 ===")
 
     import tempfile
-    import threading
-    from concurrent.futures import ThreadPoolExecutor
 
     with tempfile.TemporaryDirectory() as temp_dir:
         config_file = os.path.join(temp_dir, 'test_config.json')
 
         try:
+            # 真实Config冒烟测试：调度器启动后处于运行状态，停止后不再运行
+            print("测试0: 调度器启动与停止")
             config = Config(config_file)
-            updater = ZedUpdater(config)
-            scheduler = UpdateScheduler(updater, config)
+            scheduler = UpdateScheduler(ZedUpdater(config), config)
+            scheduler.start()
+            started = bool(scheduler.is_running())
+            scheduler.stop()
+            stopped = not scheduler.is_running()
+            print(f"  启动后运行中: {started}")
+            print(f"  停止后已停止: {stopped}")
+            test0_passed = started and stopped
+            print(f"  测试结果: {'✅ 通过' if test0_passed else '❌ 失败'}")
 
-            # 测试1: 基本重试功能
-            print("测试1: 基本重试功能")
-            with patch('updater.updater.requests.Session.get') as mock_get:
-                # 模拟前两次失败，第三次成功
-                mock_response = Mock()
-                mock_response.raise_for_status.return_value = None
-                mock_response.headers.get.return_value = '1024'
-                mock_response.iter_content.return_value = [b'x' * 1024]
-
-                mock_get.side_effect = [
-                    Exception("网络超时"),
-                    Exception("连接失败"),
-                    mock_response
-                ]
 
+            # 重试测试使用内存配置桩
+            updater = ZedUpdater(_StubConfig())
+
+            # 测试1: 基本重试功能
+            print("\n测试1: 基本重试功能")
+            # 模拟前两次失败，第三次成功
+            with fast_patch_get([Exception("网络超时"), Exception("连接失败"), _OK]) as mock_get:
                 updater.download_url = 'http://example.com/test.exe'
 
                 success = updater.download_update() is not None
@@ -73,27 +150,17 @@ def test_retry_mechanism():
             import time
             start_time = time.time()
 
-            with patch('updater.updater.requests.Session.get') as mock_get:
+            # 前两次失败，最后一次成功
+            with fast_patch_get([Exception("网络错误"), Exception("连接错误"), _OK]):
                 with patch('updater.updater.time.sleep') as mock_sleep:
-                    mock_response = Mock()
-                    mock_response.raise_for_status.return_value = None
-                    mock_response.headers.get.return_value = '1024'
-                    mock_response.iter_content.return_value = [b'x' * 1024]
-
-                    # 前两次失败，最后一次成功
-                    mock_get.side_effect = [
-                        Exception("网络错误"),
-                        Exception("连接错误"),
-                        mock_response
-                    ]
-
                     updater.download_url = 'http://example.com/test.exe'
                     updater.download_update()
 
                     # 检查是否使用了指数退避
-                    sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+                    sleep_calls = [call.args[0] for call in mock_sleep.call_args_list]
                     if len(sleep_calls) >= 2:
-                        backoff_increasing = sleep_calls[0] < sleep_calls[1] if len(sleep_calls) > 1 else True
+                        # 整个退避序列必须严格递增
+                        backoff_increasing = all(a < b for a, b in zip(sleep_calls, sleep_calls[1:]))
                         print(f"  退避时间序列: {sleep_calls}")
                         print(f"  退避时间递增: {backoff_increasing}")
                         test2_passed = backoff_increasing
@@ -104,10 +171,8 @@ def test_retry_mechanism():
 
             # 测试3: 最大重试限制
             print("\n测试3: 最大重试限制")
-            with patch('updater.updater.requests.Session.get') as mock_get:
-                # 一直失败
-                mock_get.side_effect = Exception("持久网络错误")
-
+            # 一直失败
+            with fast_patch_get(itertools.repeat(Exception("持久网络错误"))) as mock_get:
                 updater.download_url = 'http://example.com/test.exe'
                 result = updater.download_update()
 
@@ -119,38 +184,28 @@ def test_retry_mechanism():
 
             # 测试4: 并发请求处理
             print("\n测试4: 并发请求处理")
+            worker_count = 3
+            worker_urls = [f'http://example.com/test_{i}.exe' for i in range(worker_count)]
+
             def mock_download_worker(worker_id):
                 """模拟并发下载操作"""
                 try:
-                    # 每个worker创建自己的updater实例
-                    with tempfile.TemporaryDirectory() as worker_temp:
-                        worker_config = Config(os.path.join(worker_temp, f'config_{worker_id}.json'))
-                        worker_updater = ZedUpdater(worker_config)
-
-                        with patch('updater.updater.requests.Session.get') as worker_mock_get:
-                            mock_response = Mock()
-                            mock_response.raise_for_status.return_value = None
-                            mock_response.headers.get.return_value = '1024'
-                            mock_response.iter_content.return_value = [b'x' * 1024]
-
-                            # 第一个请求失败，第二个成功
-                            worker_mock_get.side_effect = [
-                                Exception("并发网络冲突"),
-                                mock_response
-                            ]
-
-                            worker_updater.download_url = f'http://example.com/test_{worker_id}.exe'
-                            success = worker_updater.download_update()
-                            return success is not None
+                    # 每个worker使用自己的updater实例和内存配置
+                    worker_updater = ZedUpdater(_StubConfig())
+                    worker_updater.download_url = worker_urls[worker_id]
+                    success = worker_updater.download_update()
+                    return success is not None
 
                 except Exception as e:
                     print(f"  Worker {worker_id} 错误: {e}")
                     return False
 
-            # 启动多个并发worker
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = [executor.submit(mock_download_worker, i) for i in range(3)]
-                concurrent_results = [future.result() for future in futures]
+            # 每个URL第一个请求失败，第二个成功；所有worker在第一次请求处汇合后才继续
+            scripts = {url: [Exception("并发网络冲突"), _OK] for url in worker_urls}
+            barrier = threading.Barrier(worker_count, timeout=10)
+            with patch_get_by_url(scripts, barrier), patch('updater.updater.time.sleep'):
+                with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                    concurrent_results = list(executor.map(mock_download_worker, range(worker_count)))
 
             all_concurrent_succeeded = all(concurrent_results)
             print(f"  并发结果: {concurrent_results}")
@@ -159,9 +214,10 @@ def test_retry_mechanism():
             test4_passed = all_concurrent_succeeded
 
             # 总体结果
-            all_tests_passed = test1_passed and test2_passed and test3_passed and test4_passed
+            all_tests_passed = test0_passed and test1_passed and test2_passed and test3_passed and test4_passed
             print("\n" + "="*50)
             print("网络重试机制测试总结:")
+            print(f"调度器启动停止: {'✅' if test0_passed else '❌'}")
             print(f"基本重试功能: {'✅' if test1_passed else '❌'}")
             print(f"指数退避策略: {'✅' if test2_passed else '❌'}")
             print(f"最大重试限制: {'✅' if test3_passed else '❌'}")
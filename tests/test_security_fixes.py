@@ -7,92 +7,88 @@
 
 import os
 import sys
-import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from updater.updater import ZedUpdater
 
 
-class TestSecurityFixes(unittest.TestCase):
-    """测试安全修复"""
+@pytest.fixture(scope='module')
+def updater():
+    """整个模块共用一个更新器实例；_safe_filename_from_url是纯函数，不会在用例间泄漏状态"""
+    return ZedUpdater(MagicMock())
 
-    def setUp(self):
-        """测试前准备"""
-        self.config_mock = MagicMock()
-        self.updater = ZedUpdater(self.config_mock)
 
-    def test_safe_filename_normal_url(self):
+class TestSecurityFixes:
+    """测试安全修复"""
+
+    def test_safe_filename_normal_url(self, updater):
         """测试正常URL的文件名生成"""
         url = "https://github.com/user/repo/releases/download/v1.0.0/zed-v1.0.0.zip"
-        result = self.updater._safe_filename_from_url(url)
-        self.assertTrue(result.endswith('.zip'))
-        self.assertNotIn('..', result)
-        self.assertNotIn('/', result)
-        self.assertNotIn('\\', result)
-
-    def test_safe_filename_path_traversal(self):
+        result = updater._safe_filename_from_url(url)
+        assert result.endswith('.zip')
+        assert '..' not in result
+        assert '/' not in result
+        assert '\\' not in result
+
+    @pytest.mark.parametrize('url', [
+        "https://example.com/../../../etc/passwd",
+        "https://example.com/..\\..\\windows\\system32\\cmd.exe",
+        "https://example.com/path/../../secret.txt",
+    ])
+    def test_safe_filename_path_traversal(self, updater, url):
         """测试路径遍历攻击防护"""
-        malicious_urls = [
-            "https://example.com/../../../etc/passwd",
-            "https://example.com/..\\..\\windows\\system32\\cmd.exe",
-            "https://example.com/path/../../secret.txt"
-        ]
-
-        for url in malicious_urls:
-            with self.subTest(url=url):
-                result = self.updater._safe_filename_from_url(url)
-                # 应该返回安全文件名，不包含路径遍历字符
-                self.assertNotIn('..', result)
-                self.assertTrue(result.startswith(('download_', 'zed_update_', 'example.com_')))
-
-    def test_safe_filename_special_characters(self):
+        result = updater._safe_filename_from_url(url)
+        # 应该返回安全文件名，不包含路径遍历字符
+        assert '..' not in result
+        assert result.startswith(('download_', 'zed_update_', 'example.com_'))
+
+    def test_safe_filename_special_characters(self, updater):
         """测试特殊字符处理"""
         url = "https://example.com/file:with*special<characters>.exe"
-        result = self.updater._safe_filename_from_url(url)
+        result = updater._safe_filename_from_url(url)
         # 特殊字符应该被替换为下划线
-        self.assertNotIn(':', result)
-        self.assertNotIn('*', result)
-        self.assertNotIn('<', result)
-        self.assertNotIn('>', result)
+        assert ':' not in result
+        assert '*' not in result
+        assert '<' not in result
+        assert '>' not in result
 
-    def test_safe_filename_empty_url(self):
+    def test_safe_filename_empty_url(self, updater):
         """测试空URL处理"""
-        result = self.updater._safe_filename_from_url("")
-        self.assertTrue(result.startswith('zed_update_'))
-        self.assertTrue(result.endswith('.zip'))
-
-    def test_safe_filename_invalid_url(self):
+        result = updater._safe_filename_from_url("")
+        assert result.startswith('zed_update_')
+        assert result.endswith('.zip')
+
+    @pytest.mark.parametrize('url,expected_prefix', [
+        (None, 'zed_update_'),
+        ("not-a-url", 'zed_update_'),
+        ("http://", 'zed_update_'),
+        ("https://", 'zed_update_'),
+    ])
+    def test_safe_filename_invalid_url(self, updater, url, expected_prefix):
         """测试无效URL处理"""
-        invalid_urls = [
-            None,
-            "not-a-url",
-            "http://",
-            "https://"
-        ]
-
-        for url in invalid_urls:
-            with self.subTest(url=url):
-                result = self.updater._safe_filename_from_url(url)
-                self.assertTrue(result.startswith('zed_update_'))
-
-    def test_safe_filename_length_limit(self):
+        result = updater._safe_filename_from_url(url)
+        assert result.startswith(expected_prefix)
+
+    def test_safe_filename_length_limit(self, updater):
         """测试文件名长度限制"""
         long_name = "a" * 150
         url = f"https://example.com/{long_name}.zip"
-        result = self.updater._safe_filename_from_url(url)
-        self.assertLessEqual(len(result), 100)
+        result = updater._safe_filename_from_url(url)
+        assert len(result) <= 100
 
-    def test_safe_filename_hidden_files(self):
+    def test_safe_filename_hidden_files(self, updater):
         """测试隐藏文件防护"""
         url = "https://example.com/.hidden_file.exe"
-        result = self.updater._safe_filename_from_url(url)
-        self.assertFalse(result.startswith('.'))
-        self.assertNotIn('..', result)
+        result = updater._safe_filename_from_url(url)
+        assert not result.startswith('.')
+        assert '..' not in result
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '-n', 'auto']))
@@ -9,14 +9,25 @@ import os
 import sys
 import json
 import logging
+import logging.handlers
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
 from updater.encoding_utils import EncodingUtils
 from updater.config import Config
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from zed_updater.utils import logger as zed_logger
+from zed_updater.utils.logger import setup_logging, get_logger
+
 class UTF8Tester:
     """UTF-8编码测试器"""
 
@@ -25,13 +36,15 @@ class UTF8Tester:
         self.setup_logging()
 
     def setup_logging(self):
-        """设置日志"""
+        """设置日志（输出先缓冲，print_summary结束时一次写出）"""
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self.log_buffer = logging.handlers.MemoryHandler(
+            1000, flushLevel=logging.CRITICAL, target=stream_handler
+        )
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=[self.log_buffer]
         )
         self.logger = logging.getLogger(__name__)
 
@@ -81,27 +94,39 @@ class UTF8Tester:
                 "成功✅下载最新版本",
             ]
 
-            for text in test_texts:
-                # 测试UTF-8兼容性
+            # 用不会出现在测试文本中的分隔符拼接，整体只做一次编码/解码/规范化
+            separator = "\u0001"
+            blob = separator.join(test_texts)
+
+            # 每条文本的日志标签只构建一次
+            labels = [text[:10] + "..." for text in test_texts]
+
+            # 测试UTF-8兼容性
+            for text, label in zip(test_texts, labels):
                 is_utf8 = EncodingUtils.is_utf8_compatible(text)
-                self.log_result(f"UTF-8兼容性检查: '{text[:10]}...'", is_utf8)
+                self.log_result(f"UTF-8兼容性检查: '{label}'", is_utf8)
 
-                # 测试编码/解码
-                try:
-                    encoded = EncodingUtils.safe_encode(text)
-                    decoded = EncodingUtils.safe_decode(encoded)
-                    success = decoded == text
-                    self.log_result(f"编码解码测试: '{text[:10]}...'", success)
-                except Exception as e:
-                    self.log_result(f"编码解码测试: '{text[:10]}...'", False, str(e))
+            # 孤立代理字符无法编码为UTF-8，必须判定为不兼容
+            lone_surrogate = "损坏的文本\ud800"
+            self.log_result("UTF-8兼容性检查: 孤立代理字符",
+                            not EncodingUtils.is_utf8_compatible(lone_surrogate))
 
-                # 测试文本规范化
-                try:
-                    normalized = EncodingUtils.normalize_text(text)
-                    success = isinstance(normalized, str)
-                    self.log_result(f"文本规范化: '{text[:10]}...'", success)
-                except Exception as e:
-                    self.log_result(f"文本规范化: '{text[:10]}...'", False, str(e))
+            # 测试编码/解码
+            try:
+                encoded = EncodingUtils.safe_encode(blob)
+                decoded_texts = EncodingUtils.safe_decode(encoded).split(separator)
+                for text, label, decoded in zip(test_texts, labels, decoded_texts):
+                    self.log_result(f"编码解码测试: '{label}'", decoded == text)
+            except Exception as e:
+                self.log_result("编码解码测试", False, str(e))
+
+            # 测试文本规范化
+            try:
+                normalized_texts = EncodingUtils.normalize_text(blob).split(separator)
+                for label, normalized in zip(labels, normalized_texts):
+                    self.log_result(f"文本规范化: '{label}'", isinstance(normalized, str))
+            except Exception as e:
+                self.log_result("文本规范化", False, str(e))
 
         except Exception as e:
             self.log_result("中文文本处理测试", False, str(e))
@@ -142,13 +167,10 @@ class UTF8Tester:
 
                         # 读取文件
                         read_content = EncodingUtils.read_text_file(test_file)
-                        read_success = read_content is not None
-                        self.log_result(f"文件读取测试 ({encoding})", read_success)
+                        self.log_result(f"文件读取测试 ({encoding})", read_content is not None)
 
-                        # 内容比较
-                        if read_content:
-                            content_match = EncodingUtils.normalize_text(read_content.strip()) == EncodingUtils.normalize_text(test_content.strip())
-                            self.log_result(f"内容匹配测试 ({encoding})", content_match)
+                        # 内容比较：读回的内容必须与写入的完全一致
+                        self.log_result(f"内容匹配测试 ({encoding})", read_content == test_content)
 
                 except Exception as e:
                     self.log_result(f"文件操作测试 ({encoding})", False, str(e))
@@ -188,9 +210,13 @@ class UTF8Tester:
 
             test_config_file = Path("test_config_utf8.json")
 
-            # 测试JSON序列化（确保中文字符正确处理）
+            # 测试JSON序列化（确保中文字符正确处理），结果供写入测试复用
+            json_str = None
             try:
-                json_str = json.dumps(test_config_data, ensure_ascii=False, indent=4)
+                if orjson is not None:
+                    json_str = orjson.dumps(test_config_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+                else:
+                    json_str = json.dumps(test_config_data, ensure_ascii=False, indent=4)
                 success = "程序名称" in json_str and "自动检查" in json_str
                 self.log_result("JSON序列化测试", success)
             except Exception as e:
@@ -200,15 +226,16 @@ class UTF8Tester:
             try:
                 success = EncodingUtils.write_text_file(
                     test_config_file,
-                    json.dumps(test_config_data, ensure_ascii=False, indent=4),
+                    json_str,
                     'utf-8-sig'
                 )
                 self.log_result("配置文件写入", success)
             except Exception as e:
                 self.log_result("配置文件写入", False, str(e))
 
-            # 测试配置文件读取
-            if test_config_file.exists():
+            # 测试配置文件读取（存在性只检查一次，清理时复用）
+            config_file_exists = test_config_file.exists()
+            if config_file_exists:
                 try:
                     content = EncodingUtils.read_text_file(test_config_file)
                     if content:
@@ -222,7 +249,7 @@ class UTF8Tester:
 
             # 清理测试文件
             try:
-                if test_config_file.exists():
+                if config_file_exists:
                     test_config_file.unlink()
                     self.log_result("测试配置文件清理", True)
             except Exception as e:
@@ -237,15 +264,6 @@ class UTF8Tester:
             # 创建测试日志文件
             test_log_file = Path("test_utf8.log")
 
-            # 设置测试日志器
-            test_logger = logging.getLogger("utf8_test")
-            test_logger.setLevel(logging.INFO)
-
-            # 添加文件处理器
-            file_handler = logging.FileHandler(test_log_file, encoding='utf-8', mode='w')
-            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-            test_logger.addHandler(file_handler)
-
             # 测试中文日志消息
             test_messages = [
                 "程序启动成功 ✅",
@@ -257,18 +275,37 @@ class UTF8Tester:
                 "程序退出 👋"
             ]
 
-            for msg in test_messages:
-                test_logger.info(msg)
-
-            # 关闭处理器
-            file_handler.close()
-            test_logger.removeHandler(file_handler)
-
-            # 验证日志文件
-            if test_log_file.exists():
+            # 经项目的日志配置写入文件；setup_logging会替换根日志器的处理器，结束后恢复
+            root_logger = logging.getLogger()
+            saved_handlers = root_logger.handlers[:]
+            saved_level = root_logger.level
+            try:
+                setup_logging(level='INFO', log_file=str(test_log_file), use_colors=False)
+                test_logger = get_logger("utf8_test")
+                for msg in test_messages:
+                    test_logger.info(msg)
+            finally:
+                # 停止QueueListener，确保排队的记录全部写入文件后再关闭文件
+                listener = zed_logger._queue_listener
+                zed_logger._stop_queue_listener()
+                if listener is not None:
+                    for handler in listener.handlers:
+                        handler.close()
+                for handler in root_logger.handlers[:]:
+                    root_logger.removeHandler(handler)
+                for handler in saved_handlers:
+                    root_logger.addHandler(handler)
+                root_logger.setLevel(saved_level)
+                logging.disable(logging.NOTSET)
+
+            # 验证日志文件（存在性只检查一次，清理时复用）
+            log_file_exists = test_log_file.exists()
+            if log_file_exists:
                 content = EncodingUtils.read_text_file(test_log_file)
                 if content:
-                    success = all(msg in content for msg in test_messages)
+                    # 每行只取消息部分（格式为 时间 - 级别 - 日志器 - 消息），用集合一次比较
+                    logged_messages = {line.split(' - ', 3)[-1] for line in content.splitlines()}
+                    success = set(test_messages).issubset(logged_messages)
                     self.log_result("中文日志记录", success)
                 else:
                     self.log_result("中文日志记录", False, "无法读取日志文件")
@@ -277,7 +314,7 @@ class UTF8Tester:
 
             # 清理测试日志文件
             try:
-                if test_log_file.exists():
+                if log_file_exists:
                     test_log_file.unlink()
                     self.log_result("测试日志文件清理", True)
             except Exception as e:
@@ -299,13 +336,22 @@ class UTF8Tester:
                 "控制台输出测试结束 ✅"
             ]
 
+            # 先用控制台编码试编码一次，能编码则整体一次写出
+            output = "\n".join(test_messages) + "\n"
+            console_encoding = sys.stdout.encoding or "ascii"
+            try:
+                output.encode(console_encoding)
+                can_encode = True
+            except (UnicodeEncodeError, LookupError) as e:
+                can_encode = False
+                self.logger.warning(f"控制台编码 {console_encoding} 无法输出中文: {e}")
+
             success_count = 0
-            for msg in test_messages:
+            if can_encode:
                 try:
-                    print(msg)
-                    success_count += 1
-                except UnicodeEncodeError as e:
-                    self.logger.warning(f"控制台输出失败: {msg[:20]}... - {e}")
+                    sys.stdout.write(output)
+                    sys.stdout.flush()
+                    success_count = len(test_messages)
                 except Exception as e:
                     self.logger.error(f"控制台输出错误: {e}")
 
@@ -321,7 +367,7 @@ class UTF8Tester:
         self.logger.info("开始UTF-8编码兼容性测试")
         self.logger.info("=" * 60)
 
-        # 运行各项测试
+        # 各项测试共享标准输出、环境变量与当前目录下的文件，按顺序运行
         self.test_environment_setup()
         self.test_chinese_text_handling()
         self.test_file_operations()
@@ -363,6 +409,8 @@ class UTF8Tester:
         else:
             self.logger.info(f"⚠️  有 {failed_tests} 个测试失败，建议检查相关功能")
 
+        self.log_buffer.flush()
+
 def main():
     """主函数"""
     try:
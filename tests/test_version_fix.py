@@ -6,6 +6,7 @@
 
 import sys
 import os
+from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
 from updater.config import Config
@@ -21,8 +22,8 @@ def test_version_fix():
         zed_path = config.get_setting('zed_install_path', 'D:\\Zed.exe')
         print(f"配置中的Zed路径: {zed_path}")
 
-        from pathlib import Path
-        if not Path(zed_path).exists():
+        zed_exists = Path(zed_path).exists()
+        if not zed_exists:
             print(f"警告: Zed.exe不存在于 {zed_path}")
             return
 